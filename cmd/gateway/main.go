@@ -13,6 +13,7 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -47,6 +48,39 @@ func fileMD5Hex(path string) (string, error) {
 	return hex.EncodeToString(h.Sum(nil)), nil
 }
 
+// etagCache 缓存已计算的文件ETag，避免每次请求都全量读文件做MD5
+// 以 size+mtime 识别文件版本，文件被覆盖后会自动重算
+type etagEntry struct {
+	size    int64
+	modTime time.Time
+	etag    string
+}
+
+var (
+	etagMu    sync.RWMutex
+	etagCache = make(map[string]etagEntry)
+)
+
+// cachedETag 返回文件ETag，同一版本的文件只计算一次MD5
+func cachedETag(path string, fi os.FileInfo) (string, error) {
+	etagMu.RLock()
+	entry, ok := etagCache[path]
+	etagMu.RUnlock()
+	if ok && entry.size == fi.Size() && entry.modTime.Equal(fi.ModTime()) {
+		return entry.etag, nil
+	}
+
+	etag, err := fileMD5Hex(path)
+	if err != nil {
+		return "", err
+	}
+
+	etagMu.Lock()
+	etagCache[path] = etagEntry{size: fi.Size(), modTime: fi.ModTime(), etag: etag}
+	etagMu.Unlock()
+	return etag, nil
+}
+
 func writeHead(w http.ResponseWriter, full string, fi os.FileInfo) {
 	ctype := mime.TypeByExtension(filepath.Ext(full))
 	if ctype == "" {
@@ -55,7 +89,7 @@ func writeHead(w http.ResponseWriter, full string, fi os.FileInfo) {
 	w.Header().Set("Content-Type", ctype)
 	w.Header().Set("Content-Length", fmt.Sprintf("%d", fi.Size()))
 	w.Header().Set("Last-Modified", fi.ModTime().UTC().Format(http.TimeFormat))
-	if etag, err := fileMD5Hex(full); err == nil {
+	if etag, err := cachedETag(full, fi); err == nil {
 		w.Header().Set("ETag", etag)
 	}
 }
@@ -73,7 +107,7 @@ func handleListObjectsV2(w http.ResponseWriter, basePath, bucket, prefix string)
 			return nil
 		}
 		rel, _ := filepath.Rel(basePath, path)
-		etag, _ := fileMD5Hex(path)
+		etag, _ := cachedETag(path, info)
 		files = append(files, object{
 			Key:          rel,
 			LastModified: info.ModTime().UTC().Format(time.RFC3339),
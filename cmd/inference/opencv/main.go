@@ -1,20 +1,37 @@
 package main
 
 import (
+	"bytes"
 	"encoding/base64"
 	"encoding/json"
 	"flag"
 	"fmt"
 	"image"
+	"image/color"
 	"io"
 	"log"
 	"net/http"
 	"os"
+	"path/filepath"
 	"strings"
+	"sync"
+	"time"
 
 	"gocv.io/x/gocv"
 )
 
+// resultsDir 标注结果图片的保存目录
+const resultsDir = "results"
+
+// 结果图片的保留时长与清理周期，过期文件由后台协程定期删除
+const (
+	resultTTL           = 10 * time.Minute
+	resultSweepInterval = time.Minute
+)
+
+// boxColor 标注框和标签的绘制颜色，进程级常量，不在请求内重建
+var boxColor = color.RGBA{R: 0, G: 255, B: 0, A: 255}
+
 // Config 服务配置
 type Config struct {
 	CascadeType string
@@ -25,17 +42,25 @@ type Config struct {
 
 // OpenCVServer OpenCV推理服务器
 type OpenCVServer struct {
-	config    *Config
+	config     *Config
 	classifier *gocv.CascadeClassifier
-	logger    *log.Logger
+	logger     *log.Logger
+
+	// base64解码目标缓冲池：避免每请求分配一块图片大小的内存
+	b64Pool sync.Pool
+
+	// 预序列化的health/info响应字节，级联加载后内容不变
+	healthJSON []byte
+	infoJSON   []byte
 }
 
 // PredictRequest 推理请求
 type PredictRequest struct {
-	Image          string  `json:"image"`           // base64编码的图片
-	ScaleFactor    float64 `json:"scale_factor"`    // 缩放因子，默认1.1
-	MinNeighbors   int     `json:"min_neighbors"`   // 最小邻居数，默认3
-	MinSize        int     `json:"min_size"`        // 最小尺寸，默认30
+	Image        string  `json:"image"`         // base64编码的图片
+	ScaleFactor  float64 `json:"scale_factor"`  // 缩放因子，默认1.1
+	MinNeighbors int     `json:"min_neighbors"` // 最小邻居数，默认3
+	MinSize      int     `json:"min_size"`      // 最小尺寸，默认30
+	ReturnImage  bool    `json:"return_image"`  // 是否生成标注结果图片，默认false
 }
 
 // Detection 检测结果
@@ -46,23 +71,24 @@ type Detection struct {
 
 // PredictResponse 推理响应
 type PredictResponse struct {
-	Detections []Detection `json:"detections"`
-	Count      int         `json:"count"`
+	Detections      []Detection `json:"detections"`
+	Count           int         `json:"count"`
+	ResultImagePath string      `json:"result_image_path,omitempty"` // 标注结果图片路径
 }
 
 // HealthResponse 健康检查响应
 type HealthResponse struct {
-	Status       string `json:"status"`
-	CascadeType  string `json:"cascade_type"`
+	Status      string `json:"status"`
+	CascadeType string `json:"cascade_type"`
 }
 
 // InfoResponse 信息响应
 type InfoResponse struct {
-	ServiceType  string `json:"service_type"`
-	CascadeType  string `json:"cascade_type"`
-	CascadePath  string `json:"cascade_path"`
-	Version      string `json:"version"`
-	Loaded       bool   `json:"loaded"`
+	ServiceType string `json:"service_type"`
+	CascadeType string `json:"cascade_type"`
+	CascadePath string `json:"cascade_path"`
+	Version     string `json:"version"`
+	Loaded      bool   `json:"loaded"`
 }
 
 func main() {
@@ -150,20 +176,104 @@ func (s *OpenCVServer) LoadCascade() error {
 	s.classifier = &classifier
 	s.logger.Printf("Cascade loaded successfully")
 
+	// 预热：级联加载后首次扫描要初始化内部金字塔缓存等惰性状态，
+	// 在启动阶段用空白图片吃掉这部分开销，首个真实请求不再额外变慢
+	s.warmUp()
+
 	return nil
 }
 
+// warmUp 用空白图片执行一次检测，吃掉首次扫描的惰性初始化开销
+func (s *OpenCVServer) warmUp() {
+	start := time.Now()
+
+	dummy := gocv.NewMatWithSize(320, 320, gocv.MatTypeCV8UC3)
+	defer dummy.Close()
+	s.detect(&dummy, 1.1, 3, 30)
+
+	s.logger.Printf("Warm-up detection completed in %v", time.Since(start))
+}
+
 // Start 启动HTTP服务器
 func (s *OpenCVServer) Start() error {
 	addr := fmt.Sprintf("%s:%d", s.config.Host, s.config.Port)
 
-	// 注册路由
-	http.HandleFunc("/predict", s.handlePredict)
-	http.HandleFunc("/health", s.handleHealth)
-	http.HandleFunc("/info", s.handleInfo)
+	// 级联已加载完成，health/info响应此后不变，编码一次即可
+	s.buildStaticResponses()
+
+	// 创建结果图片目录
+	if err := os.MkdirAll(resultsDir, 0755); err != nil {
+		return fmt.Errorf("failed to create results directory: %w", err)
+	}
+
+	// 启动结果图片清理协程，防止results目录无限增长占满磁盘
+	go s.sweepResults()
+
+	// 注册路由（独立mux，不污染全局DefaultServeMux）
+	mux := http.NewServeMux()
+	mux.HandleFunc("/predict", s.handlePredict)
+	mux.HandleFunc("/predict/file", s.handlePredictFile)
+	mux.HandleFunc("/result/", s.handleResult)
+	mux.HandleFunc("/health", s.handleHealth)
+	mux.HandleFunc("/info", s.handleInfo)
+
+	// 显式配置服务器超时，慢客户端不会长期占用连接
+	srv := &http.Server{
+		Addr:              addr,
+		Handler:           mux,
+		ReadHeaderTimeout: 10 * time.Second,
+		ReadTimeout:       30 * time.Second,
+		WriteTimeout:      30 * time.Second,
+		IdleTimeout:       60 * time.Second,
+	}
 
 	s.logger.Printf("Starting OpenCV inference server on %s", addr)
-	return http.ListenAndServe(addr, nil)
+	return srv.ListenAndServe()
+}
+
+// sweepResults 定期删除超过保留时长的结果图片
+func (s *OpenCVServer) sweepResults() {
+	ticker := time.NewTicker(resultSweepInterval)
+	defer ticker.Stop()
+
+	for range ticker.C {
+		entries, err := os.ReadDir(resultsDir)
+		if err != nil {
+			continue
+		}
+
+		cutoff := time.Now().Add(-resultTTL)
+		for _, entry := range entries {
+			if entry.IsDir() {
+				continue
+			}
+			info, err := entry.Info()
+			if err != nil {
+				continue
+			}
+			if info.ModTime().Before(cutoff) {
+				os.Remove(filepath.Join(resultsDir, entry.Name()))
+			}
+		}
+	}
+}
+
+// handleResult 返回标注结果图片
+// http.ServeFile走内核sendfile零拷贝，并自动处理条件请求
+func (s *OpenCVServer) handleResult(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodGet && r.Method != http.MethodHead {
+		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	filename := strings.TrimPrefix(r.URL.Path, "/result/")
+	// 只允许访问results目录下的单层文件名，拒绝路径穿越
+	if filename == "" || filename != filepath.Base(filename) {
+		http.Error(w, "Invalid filename", http.StatusBadRequest)
+		return
+	}
+
+	http.ServeFile(w, r, filepath.Join(resultsDir, filename))
 }
 
 // handlePredict 处理推理请求
@@ -180,15 +290,26 @@ func (s *OpenCVServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// 设置默认值
+	// 设置默认值并校验参数：OpenCV的detectMultiScale断言
+	// scaleFactor > 1，非法值会触发CV_Assert直接崩掉整个服务，
+	// 必须在进入原生调用前拦截
 	if req.ScaleFactor == 0 {
 		req.ScaleFactor = 1.1
+	} else if req.ScaleFactor <= 1.0 {
+		http.Error(w, "Invalid scale_factor: must be greater than 1.0", http.StatusBadRequest)
+		return
 	}
 	if req.MinNeighbors == 0 {
 		req.MinNeighbors = 3
+	} else if req.MinNeighbors < 0 {
+		http.Error(w, "Invalid min_neighbors: must not be negative", http.StatusBadRequest)
+		return
 	}
 	if req.MinSize == 0 {
 		req.MinSize = 30
+	} else if req.MinSize < 0 {
+		http.Error(w, "Invalid min_size: must not be negative", http.StatusBadRequest)
+		return
 	}
 
 	// 解码图片
@@ -202,10 +323,17 @@ func (s *OpenCVServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 	// 执行检测
 	detections := s.detect(&img, req.ScaleFactor, req.MinNeighbors, req.MinSize)
 
+	// 仅在客户端请求时绘制并保存标注结果图片
+	var resultPath string
+	if req.ReturnImage {
+		resultPath = s.drawAndSaveResult(&img, detections)
+	}
+
 	// 返回结果
 	resp := PredictResponse{
-		Detections: detections,
-		Count:      len(detections),
+		Detections:      detections,
+		Count:           len(detections),
+		ResultImagePath: resultPath,
 	}
 
 	w.Header().Set("Content-Type", "application/json")
@@ -214,64 +342,107 @@ func (s *OpenCVServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 	s.logger.Printf("Detection completed: %d %ss found", len(detections), s.config.CascadeType)
 }
 
-// handleHealth 健康检查
-func (s *OpenCVServer) handleHealth(w http.ResponseWriter, r *http.Request) {
-	resp := HealthResponse{
-		Status:      "healthy",
-		CascadeType: s.config.CascadeType,
+// drawAndSaveResult 在BGR图片上直接绘制检测框和标签，并保存为JPEG
+// 绘制走OpenCV原生实现；编码和落盘在后台协程执行，不阻塞响应
+func (s *OpenCVServer) drawAndSaveResult(img *gocv.Mat, detections []Detection) string {
+	for _, d := range detections {
+		rect := image.Rect(d.BBox[0], d.BBox[1], d.BBox[0]+d.BBox[2], d.BBox[1]+d.BBox[3])
+		gocv.Rectangle(img, rect, boxColor, 2)
+
+		org := image.Pt(d.BBox[0], d.BBox[1]-6)
+		gocv.PutText(img, d.Type, org, gocv.FontHersheySimplex, 0.5, boxColor, 1)
 	}
 
+	resultPath := filepath.Join(resultsDir, fmt.Sprintf("result_%d.jpg", time.Now().UnixNano()))
+
+	snapshot := img.Clone()
+	go func() {
+		defer snapshot.Close()
+		if ok := gocv.IMWriteWithParams(resultPath, snapshot, []int{gocv.IMWriteJpegQuality, 95}); !ok {
+			s.logger.Printf("Warning: failed to write result image: %s", resultPath)
+		}
+	}()
+
+	return resultPath
+}
+
+// handleHealth 健康检查
+func (s *OpenCVServer) handleHealth(w http.ResponseWriter, r *http.Request) {
 	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	w.Write(s.healthJSON)
 }
 
 // handleInfo 返回服务信息
 func (s *OpenCVServer) handleInfo(w http.ResponseWriter, r *http.Request) {
-	resp := InfoResponse{
+	w.Header().Set("Content-Type", "application/json")
+	w.Write(s.infoJSON)
+}
+
+// buildStaticResponses 预序列化health/info响应：内容在级联加载后
+// 不再变化，健康探测按秒级频率打来时直接写缓存字节，不重复编码
+func (s *OpenCVServer) buildStaticResponses() {
+	s.healthJSON, _ = json.Marshal(HealthResponse{
+		Status:      "healthy",
+		CascadeType: s.config.CascadeType,
+	})
+	s.healthJSON = append(s.healthJSON, '\n')
+
+	s.infoJSON, _ = json.Marshal(InfoResponse{
 		ServiceType: "opencv",
 		CascadeType: s.config.CascadeType,
 		CascadePath: s.config.CascadePath,
 		Version:     "1.0",
 		Loaded:      s.classifier != nil,
-	}
-
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	})
+	s.infoJSON = append(s.infoJSON, '\n')
 }
 
 // decodeImage 解码base64图片
 func (s *OpenCVServer) decodeImage(imageData string) (gocv.Mat, error) {
-	// 如果是data URL格式，去掉前缀
+	// 如果是data URL格式，去掉前缀（原地切片，不做Split分配）
 	if strings.HasPrefix(imageData, "data:image") {
-		parts := strings.Split(imageData, ",")
-		if len(parts) == 2 {
-			imageData = parts[1]
+		if idx := strings.IndexByte(imageData, ','); idx >= 0 {
+			imageData = imageData[idx+1:]
 		}
 	}
 
-	// Base64解码
-	imgBytes, err := base64.StdEncoding.DecodeString(imageData)
+	// Base64解码到池化缓冲（两条解码路径都会复制数据，
+	// 函数返回后缓冲即可安全回收）
+	need := base64.StdEncoding.DecodedLen(len(imageData))
+	buf, _ := s.b64Pool.Get().([]byte)
+	if cap(buf) < need {
+		buf = make([]byte, need)
+	}
+	defer s.b64Pool.Put(buf)
+
+	n, err := base64.StdEncoding.Decode(buf[:need], []byte(imageData))
 	if err != nil {
 		return gocv.Mat{}, fmt.Errorf("base64 decode failed: %w", err)
 	}
+	imgBytes := buf[:n]
 
-	// 解码为图片
-	img, _, err := image.Decode(strings.NewReader(string(imgBytes)))
-	if err != nil {
-		// 尝试使用GoCV IMDecode
-		mat, err2 := gocv.IMDecode(imgBytes, gocv.IMReadColor)
-		if err2 != nil {
-			return gocv.Mat{}, fmt.Errorf("image decode failed: %w", err)
-		}
+	// 优先使用GoCV IMDecode：单次SIMD解码直接得到BGR Mat，
+	// 避免标准库解码后再整份复制字节并物化中间image.Image
+	mat, err := gocv.IMDecode(imgBytes, gocv.IMReadColor)
+	if err == nil && !mat.Empty() {
 		return mat, nil
 	}
 
-	// 转换为GoCV Mat
-	mat, err := gocv.ImageToMatRGB(img)
+	// 回退到标准库解码（处理IMDecode不支持的格式）
+	img, _, err2 := image.Decode(bytes.NewReader(imgBytes))
+	if err2 != nil {
+		return gocv.Mat{}, fmt.Errorf("image decode failed: %w", err)
+	}
+
+	mat, err = gocv.ImageToMatRGB(img)
 	if err != nil {
 		return gocv.Mat{}, fmt.Errorf("failed to convert to mat: %w", err)
 	}
 
+	// 后续流水线（灰度转换、结果标注、IMWrite）统一假定BGR，
+	// 回退路径在解码边界就地换到BGR，下游不再出现散落的颜色转换
+	gocv.CvtColor(mat, &mat, gocv.ColorRGBToBGR)
+
 	return mat, nil
 }
 
@@ -281,17 +452,21 @@ func (s *OpenCVServer) detect(img *gocv.Mat, scaleFactor float64, minNeighbors,
 		return []Detection{}
 	}
 
-	// 检测对象
-	rects := s.classifier.DetectMultiScale(*img)
-	
-	// 转换为Detection格式
-	var detections []Detection
+	// Haar检测只用亮度信息：先显式转为单通道灰度图，
+	// 检测阶段内存流量降为三通道BGR的1/3
+	gray := gocv.NewMat()
+	defer gray.Close()
+	gocv.CvtColor(*img, &gray, gocv.ColorBGRToGray)
+
+	// 把scaleFactor/minNeighbors/minSize直接下推到原生扫描：
+	// 小于minSize的窗口根本不会被评估，无需Go侧事后过滤
+	rects := s.classifier.DetectMultiScaleWithParams(
+		gray, scaleFactor, minNeighbors, 0,
+		image.Pt(minSize, minSize), image.Pt(0, 0))
+
+	// 转换为Detection格式（数量已知，一次性分配）
+	detections := make([]Detection, 0, len(rects))
 	for _, rect := range rects {
-		// 过滤太小的检测
-		if rect.Dx() < minSize || rect.Dy() < minSize {
-			continue
-		}
-		
 		detections = append(detections, Detection{
 			Type: s.config.CascadeType,
 			BBox: [4]int{rect.Min.X, rect.Min.Y, rect.Dx(), rect.Dy()},
@@ -350,4 +525,3 @@ func (s *OpenCVServer) handlePredictFile(w http.ResponseWriter, r *http.Request)
 	w.Header().Set("Content-Type", "application/json")
 	json.NewEncoder(w).Encode(resp)
 }
-
@@ -1,25 +1,133 @@
 package main
 
 import (
+	"bytes"
+	"container/list"
 	"encoding/base64"
 	"encoding/json"
 	"flag"
 	"fmt"
+	"hash/maphash"
 	"image"
+	"image/color"
 	"io"
 	"log"
 	"net/http"
 	"os"
+	"path/filepath"
+	"runtime"
+	"strconv"
 	"strings"
+	"sync"
+	"time"
 
 	"gocv.io/x/gocv"
 )
 
+// 批处理默认参数：并发的/predict请求会被合并为一次前向推理，
+// 摊薄每次推理的调度和算子启动开销；可通过命令行调整
+const (
+	defaultMaxBatchSize = 8
+	defaultBatchDelayMs = 5
+	defaultInputSize    = 640
+)
+
+// resultsDir 标注结果图片的保存目录
+const resultsDir = "results"
+
+// urlCacheSize image_url原始字节缓存的最大条目数
+const urlCacheSize = 32
+
+// 结果图片的保留时长与清理周期，过期文件由后台协程定期删除
+const (
+	resultTTL           = 10 * time.Minute
+	resultSweepInterval = time.Minute
+)
+
+// predCacheSize 推理结果缓存容量（LRU条目数）
+const predCacheSize = 256
+
+// numClasses YOLO输出的类别数，每行格式: [x, y, w, h, conf, class_scores...]
+const numClasses = 80
+
+// boxColor 未知类别的兜底绘制颜色
+var boxColor = color.RGBA{R: 0, G: 255, B: 0, A: 255}
+
+// classColors 类别→颜色映射，启动时生成一次：
+// 同一类别在所有帧上颜色稳定，绘制循环里只做一次索引
+var classColors = buildClassColors()
+
+func buildClassColors() []color.RGBA {
+	colors := make([]color.RGBA, numClasses)
+	// 固定种子的线性同余序列，颜色跨进程、跨重启保持一致
+	seed := uint32(12345)
+	for i := range colors {
+		seed = seed*1664525 + 1013904223
+		colors[i] = color.RGBA{R: uint8(seed >> 24), G: uint8(seed >> 16), B: uint8(seed >> 8), A: 255}
+	}
+	return colors
+}
+
+// classColor 返回类别对应的颜色，越界时使用兜底色
+func classColor(id int) color.RGBA {
+	if id >= 0 && id < len(classColors) {
+		return classColors[id]
+	}
+	return boxColor
+}
+
+// classNames 预生成的类别名表：检测结果构造时直接索引，
+// 不再为每个检测做一次格式化分配
+var classNames = buildClassNames()
+
+func buildClassNames() []string {
+	names := make([]string, numClasses)
+	for i := range names {
+		names[i] = fmt.Sprintf("class_%d", i)
+	}
+	return names
+}
+
+// className 返回类别名，越界时回退到即时格式化
+func className(id int) string {
+	if id >= 0 && id < len(classNames) {
+		return classNames[id]
+	}
+	return fmt.Sprintf("class_%d", id)
+}
+
+// DNN后端/目标名字的显式白名单：gocv的ParseNetBackend/ParseNetTarget
+// 对未知字符串不报错，而是静默回退到default/CPU，配错名字只会悄悄
+// 跑慢路径；这里显式映射，未知名字在启动时就失败
+var dnnBackends = map[string]gocv.NetBackendType{
+	"default":  gocv.NetBackendDefault,
+	"opencv":   gocv.NetBackendOpenCV,
+	"openvino": gocv.NetBackendOpenVINO,
+	"cuda":     gocv.NetBackendCUDA,
+}
+
+var dnnTargets = map[string]gocv.NetTargetType{
+	"cpu":      gocv.NetTargetCPU,
+	"fp32":     gocv.NetTargetFP32,
+	"fp16":     gocv.NetTargetFP16,
+	"vpu":      gocv.NetTargetVPU,
+	"vulkan":   gocv.NetTargetVulkan,
+	"cuda":     gocv.NetTargetCUDA,
+	"cudafp16": gocv.NetTargetCUDAFP16,
+}
+
 // Config 服务配置
 type Config struct {
 	ModelPath string
 	Port      int
 	Host      string
+	Backend   string // DNN计算后端: auto, default, opencv, openvino, cuda
+	Target    string // DNN计算目标: cpu, fp32, fp16, vpu, vulkan, cuda, cudafp16
+
+	MaxBatchSize int           // 单次前向推理最多聚合的请求数
+	BatchDelay   time.Duration // 收到首个请求后的聚合等待窗口
+	SkipWarmup   bool          // 跳过启动预热（冒烟测试等场景换取更快启动）
+	InputSize    int           // 网络输入边长（像素），卷积开销约按其平方增长
 }
 
 // YOLOServer YOLO推理服务器
@@ -27,26 +135,106 @@ type YOLOServer struct {
 	config *Config
 	net    *gocv.Net
 	logger *log.Logger
+	jobs   chan *predictJob
+
+	// 网络输入几何参数：启动时构建一次，预热与每批推理直接复用，
+	// 不在热路径上按调用重建
+	inputSize image.Point
+	blobMean  gocv.Scalar
+
+	// 预序列化的health/info响应字节，模型加载后内容不变
+	healthJSON []byte
+	infoJSON   []byte
+
+	// decodeSem 限制并发图片解码数：OpenCV解码内部已并行化，
+	// 再叠加每请求一个goroutine会造成线程超订、互相挤占缓存
+	decodeSem chan struct{}
+
+	// 解析输出用的复用缓冲，仅由batchLoop协程访问：
+	// 每次推理清空重用，稳定后不再触发扩容分配
+	scratchBoxes    []image.Rectangle
+	scratchConfs    []float32
+	scratchClassIDs []int
+	scratchShift    []image.Rectangle
+
+	// base64解码目标缓冲池：图片payload通常数百KB，
+	// 池化后高QPS下不再每请求分配一块大内存
+	b64Pool sync.Pool
+
+	// fetchClient 拉取image_url的共享HTTP客户端：
+	// 连接池+keep-alive复用，不为每次下载重建连接
+	fetchClient *http.Client
+
+	// 推理结果LRU缓存：按图片内容哈希+阈值缓存检测结果，
+	// 客户端重发同一帧（如看板刷新、关键帧重试）时跳过解码和前向推理
+	cacheSeed  maphash.Seed
+	cacheMu    sync.Mutex
+	cacheList  *list.List // front为最近使用
+	cacheItems map[string]*list.Element
+
+	// image_url原始字节的LRU缓存：同一URL换阈值重推时
+	// 省掉整个出站下载往返（本地推理快时下载往往是大头）
+	urlCacheMu    sync.Mutex
+	urlCacheList  *list.List
+	urlCacheItems map[string]*list.Element
+}
+
+// urlCacheEntry URL字节缓存条目
+type urlCacheEntry struct {
+	url  string
+	data []byte
+}
+
+// cacheEntry 推理缓存条目
+type cacheEntry struct {
+	key        string
+	detections []Detection
+	resultPath string
+}
+
+// predictJob 批处理队列中的单个推理请求
+type predictJob struct {
+	img    gocv.Mat
+	conf   float32
+	iou    float32
+	result chan predictResult
+}
+
+// predictResult 推理结果
+type predictResult struct {
+	detections []Detection
+	err        error
 }
 
 // PredictRequest 推理请求
 type PredictRequest struct {
-	Image        string  `json:"image"`         // base64编码的图片
-	Confidence   float32 `json:"confidence"`    // 置信度阈值，默认0.5
-	IOUThreshold float32 `json:"iou_threshold"` // NMS IoU阈值，默认0.4
+	Image        string   `json:"image"`            // base64编码的图片
+	Images       []string `json:"images,omitempty"` // base64图片列表（多图批量推理）
+	ImageURL     string   `json:"image_url"`        // 图片URL（image为空时使用）
+	Confidence   float32  `json:"confidence"`       // 置信度阈值，默认0.5
+	IOUThreshold float32  `json:"iou_threshold"`    // NMS IoU阈值，默认0.4
+	ReturnImage  bool     `json:"return_image"`     // 是否生成标注结果图片，默认false
 }
 
 // Detection 检测结果
 type Detection struct {
 	Class      string  `json:"class"`
+	ClassID    int     `json:"class_id"`
 	Confidence float32 `json:"confidence"`
 	BBox       [4]int  `json:"bbox"` // [x, y, width, height]
 }
 
 // PredictResponse 推理响应
 type PredictResponse struct {
-	Detections []Detection `json:"detections"`
-	Count      int         `json:"count"`
+	Detections      []Detection `json:"detections"`
+	Count           int         `json:"count"`
+	ResultImagePath string      `json:"result_image_path,omitempty"` // 标注结果图片路径
+}
+
+// BatchPredictResponse 多图批量推理响应，results与请求images顺序一一对应
+type BatchPredictResponse struct {
+	Results []PredictResponse `json:"results"`
+	Count   int               `json:"count"`
 }
 
 // HealthResponse 健康检查响应
@@ -68,8 +256,21 @@ func main() {
 	modelPath := flag.String("model", "", "Path to YOLO model file (.onnx)")
 	port := flag.Int("port", 9001, "HTTP server port")
 	host := flag.String("host", "0.0.0.0", "HTTP server host")
+	backend := flag.String("backend", "default", "DNN compute backend: auto, default, opencv, openvino, cuda")
+	target := flag.String("target", "cpu", "DNN compute target: cpu, fp32, fp16, vpu, vulkan, cuda, cudafp16")
+	maxBatch := flag.Int("max-batch-size", defaultMaxBatchSize, "Max requests merged into one forward pass")
+	batchDelayMs := flag.Int("batch-delay-ms", defaultBatchDelayMs, "Batching window in milliseconds after the first request")
+	skipWarmup := flag.Bool("skip-warmup", false, "Skip the warm-up inference after model load (faster startup for smoke tests)")
+	inputSize := flag.Int("input-size", defaultInputSize, "Network input size in pixels (640 for production accuracy, 320/416 for faster CPU inference)")
 	flag.Parse()
 
+	if *maxBatch < 1 {
+		*maxBatch = 1
+	}
+	if *inputSize < 32 {
+		*inputSize = defaultInputSize
+	}
+
 	if *modelPath == "" {
 		log.Fatal("Model path is required (--model)")
 	}
@@ -79,6 +280,13 @@ func main() {
 		ModelPath: *modelPath,
 		Port:      *port,
 		Host:      *host,
+		Backend:   *backend,
+		Target:    *target,
+
+		MaxBatchSize: *maxBatch,
+		BatchDelay:   time.Duration(*batchDelayMs) * time.Millisecond,
+		SkipWarmup:   *skipWarmup,
+		InputSize:    *inputSize,
 	}
 
 	// 创建服务器
@@ -97,10 +305,95 @@ func main() {
 
 // NewYOLOServer 创建YOLO服务器
 func NewYOLOServer(config *Config) *YOLOServer {
+	// 进程级别限制OpenCV内部线程池，避免与HTTP并发叠加后
+	// 线程数按核数平方增长
+	gocv.SetNumThreads(runtime.NumCPU())
+
 	return &YOLOServer{
-		config: config,
-		logger: log.New(os.Stdout, "[YOLO] ", log.LstdFlags),
+		config:     config,
+		inputSize:  image.Pt(config.InputSize, config.InputSize),
+		blobMean:   gocv.NewScalar(0, 0, 0, 0),
+		logger:     log.New(os.Stdout, "[YOLO] ", log.LstdFlags),
+		jobs:       make(chan *predictJob, config.MaxBatchSize*2),
+		decodeSem:  make(chan struct{}, runtime.NumCPU()),
+		cacheSeed:  maphash.MakeSeed(),
+		cacheList:  list.New(),
+		cacheItems: make(map[string]*list.Element),
+
+		urlCacheList:  list.New(),
+		urlCacheItems: make(map[string]*list.Element),
+
+		scratchBoxes:    make([]image.Rectangle, 0, 64),
+		scratchConfs:    make([]float32, 0, 64),
+		scratchClassIDs: make([]int, 0, 64),
+
+		fetchClient: &http.Client{
+			Timeout: 5 * time.Second,
+		},
+	}
+}
+
+// cacheKey 计算缓存键：图片payload哈希 + 推理阈值 + 是否带结果图
+func (s *YOLOServer) cacheKey(imageData string, conf, iou float32, withImage bool) string {
+	return fmt.Sprintf("%x:%g:%g:%t", maphash.String(s.cacheSeed, imageData), conf, iou, withImage)
+}
+
+// cacheKeyBytes 同cacheKey，但直接对二进制payload取哈希，无需字符串化
+func (s *YOLOServer) cacheKeyBytes(imageData []byte, conf, iou float32, withImage bool) string {
+	return fmt.Sprintf("%x:%g:%g:%t", maphash.Bytes(s.cacheSeed, imageData), conf, iou, withImage)
+}
+
+// cacheGet 查询缓存，命中时移动到LRU头部。
+// 带结果图的条目要确认文件仍在：结果图受TTL清理，文件被删后
+// 条目按未命中处理并移除，让调用方重新推理并生成图片，
+// 而不是把一个注定404的路径返回给客户端
+func (s *YOLOServer) cacheGet(key string) (*cacheEntry, bool) {
+	s.cacheMu.Lock()
+	defer s.cacheMu.Unlock()
+
+	elem, exists := s.cacheItems[key]
+	if !exists {
+		return nil, false
 	}
+
+	entry := elem.Value.(*cacheEntry)
+	if entry.resultPath != "" {
+		if _, err := os.Stat(entry.resultPath); err != nil {
+			s.cacheList.Remove(elem)
+			delete(s.cacheItems, key)
+			return nil, false
+		}
+	}
+
+	s.cacheList.MoveToFront(elem)
+	return entry, true
+}
+
+// cachePut 写入缓存，超出容量时淘汰最久未使用的条目
+func (s *YOLOServer) cachePut(entry *cacheEntry) {
+	s.cacheMu.Lock()
+	defer s.cacheMu.Unlock()
+
+	if elem, exists := s.cacheItems[entry.key]; exists {
+		elem.Value = entry
+		s.cacheList.MoveToFront(elem)
+		return
+	}
+
+	s.cacheItems[entry.key] = s.cacheList.PushFront(entry)
+	if s.cacheList.Len() > predCacheSize {
+		oldest := s.cacheList.Back()
+		s.cacheList.Remove(oldest)
+		delete(s.cacheItems, oldest.Value.(*cacheEntry).key)
+	}
+}
+
+// cacheClear 清空缓存（模型重新加载时调用）
+func (s *YOLOServer) cacheClear() {
+	s.cacheMu.Lock()
+	defer s.cacheMu.Unlock()
+	s.cacheList.Init()
+	s.cacheItems = make(map[string]*list.Element)
 }
 
 // LoadModel 加载YOLO模型
@@ -113,23 +406,145 @@ func (s *YOLOServer) LoadModel() error {
 		return fmt.Errorf("failed to load model from %s", s.config.ModelPath)
 	}
 
+	// 名字先过白名单，拼错的backend/target在启动时报错，
+	// 而不是被gocv静默当作default/CPU跑慢路径
+	if s.config.Backend != "" && s.config.Backend != "auto" {
+		if _, ok := dnnBackends[s.config.Backend]; !ok {
+			return fmt.Errorf("unknown DNN backend %q (valid: auto, default, opencv, openvino, cuda)", s.config.Backend)
+		}
+	}
+	if s.config.Target != "" {
+		if _, ok := dnnTargets[s.config.Target]; !ok {
+			return fmt.Errorf("unknown DNN target %q (valid: cpu, fp32, fp16, vpu, vulkan, cuda, cudafp16)", s.config.Target)
+		}
+	}
+
+	// 设置计算后端和目标（如cuda/fp16），让OpenCV DNN做算子融合和
+	// 低精度推理，而不是默认的纯CPU FP32路径。
+	// 注意gocv的SetPreferableBackend/Target只登记偏好、恒返回nil，
+	// 这里探测不到CUDA是否可用：后端真正不可用时，OpenCV DNN在
+	// 首次前向（预热或首个请求）时内部静默回退CPU路径
+	switch {
+	case s.config.Backend == "auto":
+		// auto模式请求CUDA；Target已显式指定时沿用，否则默认
+		// cudafp16：半精度使激活的访存字节减半，
+		// 在支持FP16的GPU上前向吞吐约2倍
+		target := s.config.Target
+		if target == "" || target == "cpu" {
+			target = "cudafp16"
+		}
+		net.SetPreferableBackend(gocv.NetBackendCUDA)
+		net.SetPreferableTarget(dnnTargets[target])
+		s.logger.Printf("DNN backend preference: cuda, target: %s (OpenCV falls back to CPU internally if CUDA is unavailable)", target)
+	case s.config.Backend != "" && s.config.Backend != "default":
+		net.SetPreferableBackend(dnnBackends[s.config.Backend])
+		s.logger.Printf("DNN backend preference: %s", s.config.Backend)
+	}
+	if s.config.Backend != "auto" && s.config.Target != "" && s.config.Target != "cpu" {
+		net.SetPreferableTarget(dnnTargets[s.config.Target])
+		s.logger.Printf("DNN target preference: %s", s.config.Target)
+	}
+
 	s.net = &net
+
+	// 模型变更后旧的检测结果失效
+	s.cacheClear()
+
+	// 预热：跑一次哑元前向，把算子初始化、内核选择和权重布局
+	// 的一次性开销留在加载阶段，首个真实请求直接进入稳态时延；
+	// 冒烟测试等只关心启动速度的场景可用--skip-warmup省掉这次前向
+	if !s.config.SkipWarmup {
+		s.warmUp()
+	}
+
 	s.logger.Printf("Model loaded successfully")
 
 	return nil
 }
 
+// warmUp 用全零输入执行一次前向推理
+func (s *YOLOServer) warmUp() {
+	start := time.Now()
+
+	dummy := gocv.NewMatWithSize(s.inputSize.Y, s.inputSize.X, gocv.MatTypeCV8UC3)
+	defer dummy.Close()
+
+	blob := gocv.BlobFromImage(dummy, 1.0/255.0, s.inputSize, s.blobMean, true, false)
+	defer blob.Close()
+
+	s.net.SetInput(blob, "")
+	output := s.net.Forward("")
+	output.Close()
+
+	s.logger.Printf("Warm-up inference completed in %v", time.Since(start))
+}
+
 // Start 启动HTTP服务器
 func (s *YOLOServer) Start() error {
 	addr := fmt.Sprintf("%s:%d", s.config.Host, s.config.Port)
 
-	// 注册路由
-	http.HandleFunc("/predict", s.handlePredict)
-	http.HandleFunc("/health", s.handleHealth)
-	http.HandleFunc("/info", s.handleInfo)
+	// 模型已加载完成，health/info响应此后不变，编码一次即可
+	s.buildStaticResponses()
+
+	// 创建结果图片目录
+	if err := os.MkdirAll(resultsDir, 0755); err != nil {
+		return fmt.Errorf("failed to create results directory: %w", err)
+	}
+
+	// 启动批处理协程（gocv.Net非并发安全，所有前向推理在此协程中串行执行）
+	go s.batchLoop()
+
+	// 启动结果图片清理协程，防止results目录无限增长占满磁盘
+	go s.sweepResults()
+
+	// 注册路由（独立mux，不污染全局DefaultServeMux）
+	mux := http.NewServeMux()
+	mux.HandleFunc("/predict", s.handlePredict)
+	mux.HandleFunc("/predict/file", s.handlePredictFile)
+	mux.HandleFunc("/result/", s.handleResult)
+	mux.HandleFunc("/health", s.handleHealth)
+	mux.HandleFunc("/info", s.handleInfo)
+
+	// 显式配置服务器超时，慢客户端不会长期占用连接；
+	// 读写上限按大图payload（数MB base64）留足余量
+	srv := &http.Server{
+		Addr:              addr,
+		Handler:           mux,
+		ReadHeaderTimeout: 10 * time.Second,
+		ReadTimeout:       30 * time.Second,
+		WriteTimeout:      30 * time.Second,
+		IdleTimeout:       60 * time.Second,
+	}
 
 	s.logger.Printf("Starting YOLO inference server on %s", addr)
-	return http.ListenAndServe(addr, nil)
+	return srv.ListenAndServe()
+}
+
+// sweepResults 定期删除超过保留时长的结果图片
+func (s *YOLOServer) sweepResults() {
+	ticker := time.NewTicker(resultSweepInterval)
+	defer ticker.Stop()
+
+	for range ticker.C {
+		entries, err := os.ReadDir(resultsDir)
+		if err != nil {
+			continue
+		}
+
+		cutoff := time.Now().Add(-resultTTL)
+		for _, entry := range entries {
+			if entry.IsDir() {
+				continue
+			}
+			info, err := entry.Info()
+			if err != nil {
+				continue
+			}
+			if info.ModTime().Before(cutoff) {
+				os.Remove(filepath.Join(resultsDir, entry.Name()))
+			}
+		}
+	}
 }
 
 // handlePredict 处理推理请求
@@ -139,6 +554,14 @@ func (s *YOLOServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// 原始二进制图片直接走零拷贝路径：不经过JSON和base64，
+	// 少一次解码和约33%的传输体积
+	ct := r.Header.Get("Content-Type")
+	if strings.HasPrefix(ct, "image/") || ct == "application/octet-stream" {
+		s.handlePredictRaw(w, r)
+		return
+	}
+
 	// 解析请求
 	var req PredictRequest
 	if err := json.NewDecoder(r.Body).Decode(&req); err != nil {
@@ -154,8 +577,36 @@ func (s *YOLOServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 		req.IOUThreshold = 0.4
 	}
 
-	// 解码图片
+	// 多图请求走批量路径：一次HTTP请求填满一个推理批
+	if len(req.Images) > 0 {
+		s.handlePredictBatch(w, &req)
+		return
+	}
+
+	// URL来源的图片走独立处理路径
+	if req.Image == "" && req.ImageURL != "" {
+		s.handlePredictURL(w, &req)
+		return
+	}
+
+	// 查询结果缓存：同一帧图片+相同阈值直接复用上次结果
+	key := s.cacheKey(req.Image, req.Confidence, req.IOUThreshold, req.ReturnImage)
+	if entry, hit := s.cacheGet(key); hit {
+		resp := PredictResponse{
+			Detections:      entry.detections,
+			Count:           len(entry.detections),
+			ResultImagePath: entry.resultPath,
+		}
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(resp)
+		s.logger.Printf("Prediction served from cache: %d detections", len(entry.detections))
+		return
+	}
+
+	// 解码图片（受decodeSem限流）
+	s.decodeSem <- struct{}{}
 	img, err := s.decodeImage(req.Image)
+	<-s.decodeSem
 	if err != nil {
 		http.Error(w, fmt.Sprintf("Failed to decode image: %v", err), http.StatusBadRequest)
 		return
@@ -169,10 +620,24 @@ func (s *YOLOServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	// 仅在客户端请求时绘制并保存标注结果图片：
+	// 只要JSON结果的调用方跳过整个绘制+编码+落盘路径
+	var resultPath string
+	if req.ReturnImage {
+		resultPath, err = s.drawAndSaveResult(&img, detections)
+		if err != nil {
+			s.logger.Printf("Warning: failed to save result image: %v", err)
+		}
+	}
+
+	// 写入结果缓存
+	s.cachePut(&cacheEntry{key: key, detections: detections, resultPath: resultPath})
+
 	// 返回结果
 	resp := PredictResponse{
-		Detections: detections,
-		Count:      len(detections),
+		Detections:      detections,
+		Count:           len(detections),
+		ResultImagePath: resultPath,
 	}
 
 	w.Header().Set("Content-Type", "application/json")
@@ -181,110 +646,492 @@ func (s *YOLOServer) handlePredict(w http.ResponseWriter, r *http.Request) {
 	s.logger.Printf("Prediction completed: %d detections", len(detections))
 }
 
-// handleHealth 健康检查
-func (s *YOLOServer) handleHealth(w http.ResponseWriter, r *http.Request) {
-	resp := HealthResponse{
-		Status: "healthy",
-		Model:  s.config.ModelPath,
+// handlePredictURL 处理image_url来源的推理请求：
+// 通过共享客户端下载后直接IMDecode，全程无base64
+func (s *YOLOServer) handlePredictURL(w http.ResponseWriter, req *PredictRequest) {
+	// URL即缓存键：同一URL+阈值的重复请求连下载都省掉
+	key := s.cacheKey(req.ImageURL, req.Confidence, req.IOUThreshold, req.ReturnImage)
+	if entry, hit := s.cacheGet(key); hit {
+		resp := PredictResponse{
+			Detections:      entry.detections,
+			Count:           len(entry.detections),
+			ResultImagePath: entry.resultPath,
+		}
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(resp)
+		s.logger.Printf("Prediction served from cache: %d detections", len(entry.detections))
+		return
+	}
+
+	imgBytes, err := s.fetchImage(req.ImageURL)
+	if err != nil {
+		http.Error(w, fmt.Sprintf("Failed to fetch image: %v", err), http.StatusBadGateway)
+		return
+	}
+
+	s.decodeSem <- struct{}{}
+	img, err := gocv.IMDecode(imgBytes, gocv.IMReadColor)
+	<-s.decodeSem
+	if err != nil || img.Empty() {
+		http.Error(w, "Failed to decode image", http.StatusBadRequest)
+		return
+	}
+	defer img.Close()
+
+	detections, err := s.predict(&img, req.Confidence, req.IOUThreshold)
+	if err != nil {
+		http.Error(w, fmt.Sprintf("Prediction failed: %v", err), http.StatusInternalServerError)
+		return
+	}
+
+	var resultPath string
+	if req.ReturnImage {
+		resultPath, err = s.drawAndSaveResult(&img, detections)
+		if err != nil {
+			s.logger.Printf("Warning: failed to save result image: %v", err)
+		}
+	}
+
+	s.cachePut(&cacheEntry{key: key, detections: detections, resultPath: resultPath})
+
+	resp := PredictResponse{
+		Detections:      detections,
+		Count:           len(detections),
+		ResultImagePath: resultPath,
+	}
+	w.Header().Set("Content-Type", "application/json")
+	json.NewEncoder(w).Encode(resp)
+
+	s.logger.Printf("Prediction completed: %d detections", len(detections))
+}
+
+// fetchImage 拉取URL图片字节，命中LRU缓存时不发出站请求：
+// 同一URL换不同阈值重复推理时，下载和服务端JPEG读取都只发生一次
+func (s *YOLOServer) fetchImage(url string) ([]byte, error) {
+	s.urlCacheMu.Lock()
+	if elem, exists := s.urlCacheItems[url]; exists {
+		s.urlCacheList.MoveToFront(elem)
+		data := elem.Value.(*urlCacheEntry).data
+		s.urlCacheMu.Unlock()
+		return data, nil
+	}
+	s.urlCacheMu.Unlock()
+
+	httpResp, err := s.fetchClient.Get(url)
+	if err != nil {
+		return nil, err
+	}
+	defer httpResp.Body.Close()
+	if httpResp.StatusCode != http.StatusOK {
+		return nil, fmt.Errorf("status %d", httpResp.StatusCode)
+	}
+
+	data, err := io.ReadAll(httpResp.Body)
+	if err != nil || len(data) == 0 {
+		return nil, fmt.Errorf("failed to read image data")
+	}
+
+	s.urlCacheMu.Lock()
+	if _, exists := s.urlCacheItems[url]; !exists {
+		s.urlCacheItems[url] = s.urlCacheList.PushFront(&urlCacheEntry{url: url, data: data})
+		if s.urlCacheList.Len() > urlCacheSize {
+			oldest := s.urlCacheList.Back()
+			s.urlCacheList.Remove(oldest)
+			delete(s.urlCacheItems, oldest.Value.(*urlCacheEntry).url)
+		}
+	}
+	s.urlCacheMu.Unlock()
+
+	return data, nil
+}
+
+// handlePredictBatch 处理多图批量推理请求：先把全部任务入队再收结果，
+// batchLoop得以把整组图片聚合进同一次前向推理，框架开销按批摊薄
+func (s *YOLOServer) handlePredictBatch(w http.ResponseWriter, req *PredictRequest) {
+	n := len(req.Images)
+	imgs := make([]gocv.Mat, n)
+	jobs := make([]*predictJob, n)
+
+	// 并发解码（受decodeSem限流），解码全部完成后统一入队
+	var wg sync.WaitGroup
+	decodeErrs := make([]error, n)
+	for i, data := range req.Images {
+		wg.Add(1)
+		go func(i int, data string) {
+			defer wg.Done()
+			s.decodeSem <- struct{}{}
+			imgs[i], decodeErrs[i] = s.decodeImage(data)
+			<-s.decodeSem
+		}(i, data)
+	}
+	wg.Wait()
+
+	// closeFrom 释放下标idx起尚未关闭的Mat：Mat是cgo侧原生内存，
+	// 不归Go GC管，流式地尽早关闭可把批处理的峰值内存压到单图级别
+	closeFrom := func(idx int) {
+		for i := idx; i < n; i++ {
+			if decodeErrs[i] == nil {
+				imgs[i].Close()
+			}
+		}
+	}
+
+	for i, err := range decodeErrs {
+		if err != nil {
+			closeFrom(0)
+			http.Error(w, fmt.Sprintf("Failed to decode image %d: %v", i, err), http.StatusBadRequest)
+			return
+		}
 	}
 
+	// 全部入队后再逐个等待结果，batchLoop在聚合窗口内一次取走整组
+	for i := range imgs {
+		jobs[i] = &predictJob{
+			img:    imgs[i],
+			conf:   req.Confidence,
+			iou:    req.IOUThreshold,
+			result: make(chan predictResult, 1),
+		}
+		s.jobs <- jobs[i]
+	}
+
+	// 逐个收取结果并流式释放：第i张的推理结束后其Mat立即关闭
+	// （drawAndSaveResult内部克隆后异步落盘，不再引用原Mat），
+	// 不等整批响应编码完才统一释放
+	resp := BatchPredictResponse{Results: make([]PredictResponse, n), Count: n}
+	for i, job := range jobs {
+		res := <-job.result
+		if res.err != nil {
+			// 等后续任务全部出队后再释放：batchLoop可能仍持有
+			// 这些Mat，提前关闭会释放使用中的内存
+			for j := i + 1; j < n; j++ {
+				<-jobs[j].result
+			}
+			closeFrom(i)
+			http.Error(w, fmt.Sprintf("Prediction failed: %v", res.err), http.StatusInternalServerError)
+			return
+		}
+
+		var resultPath string
+		if req.ReturnImage {
+			var err error
+			resultPath, err = s.drawAndSaveResult(&imgs[i], res.detections)
+			if err != nil {
+				s.logger.Printf("Warning: failed to save result image: %v", err)
+			}
+		}
+		imgs[i].Close()
+
+		resp.Results[i] = PredictResponse{
+			Detections:      res.detections,
+			Count:           len(res.detections),
+			ResultImagePath: resultPath,
+		}
+	}
+
+	w.Header().Set("Content-Type", "application/json")
+	json.NewEncoder(w).Encode(resp)
+
+	s.logger.Printf("Batch prediction completed: %d images", n)
+}
+
+// handlePredictRaw 处理原始二进制图片body的推理请求
+// 阈值和return_image通过query参数传递
+func (s *YOLOServer) handlePredictRaw(w http.ResponseWriter, r *http.Request) {
+	conf := float32(0.5)
+	iou := float32(0.4)
+	if v := r.URL.Query().Get("confidence"); v != "" {
+		if f, err := strconv.ParseFloat(v, 32); err == nil {
+			conf = float32(f)
+		}
+	}
+	if v := r.URL.Query().Get("iou_threshold"); v != "" {
+		if f, err := strconv.ParseFloat(v, 32); err == nil {
+			iou = float32(f)
+		}
+	}
+	returnImage := r.URL.Query().Get("return_image") == "true"
+
+	imgBytes, err := io.ReadAll(r.Body)
+	if err != nil || len(imgBytes) == 0 {
+		http.Error(w, "Failed to read image body", http.StatusBadRequest)
+		return
+	}
+
+	key := s.cacheKeyBytes(imgBytes, conf, iou, returnImage)
+	if entry, hit := s.cacheGet(key); hit {
+		resp := PredictResponse{
+			Detections:      entry.detections,
+			Count:           len(entry.detections),
+			ResultImagePath: entry.resultPath,
+		}
+		w.Header().Set("Content-Type", "application/json")
+		json.NewEncoder(w).Encode(resp)
+		s.logger.Printf("Prediction served from cache: %d detections", len(entry.detections))
+		return
+	}
+
+	// 二进制body直接IMDecode，全程无base64
+	s.decodeSem <- struct{}{}
+	img, err := gocv.IMDecode(imgBytes, gocv.IMReadColor)
+	<-s.decodeSem
+	if err != nil || img.Empty() {
+		http.Error(w, "Failed to decode image", http.StatusBadRequest)
+		return
+	}
+	defer img.Close()
+
+	detections, err := s.predict(&img, conf, iou)
+	if err != nil {
+		http.Error(w, fmt.Sprintf("Prediction failed: %v", err), http.StatusInternalServerError)
+		return
+	}
+
+	var resultPath string
+	if returnImage {
+		resultPath, err = s.drawAndSaveResult(&img, detections)
+		if err != nil {
+			s.logger.Printf("Warning: failed to save result image: %v", err)
+		}
+	}
+
+	s.cachePut(&cacheEntry{key: key, detections: detections, resultPath: resultPath})
+
+	resp := PredictResponse{
+		Detections:      detections,
+		Count:           len(detections),
+		ResultImagePath: resultPath,
+	}
 	w.Header().Set("Content-Type", "application/json")
 	json.NewEncoder(w).Encode(resp)
+
+	s.logger.Printf("Prediction completed: %d detections", len(detections))
+}
+
+// drawAndSaveResult 在BGR图片上直接绘制检测框和标签，并保存为JPEG
+// 绘制走OpenCV原生实现，无需PIL式的颜色空间/对象模型转换
+func (s *YOLOServer) drawAndSaveResult(img *gocv.Mat, detections []Detection) (string, error) {
+	// 标签在复用缓冲里用strconv拼接，绘制循环内不走fmt的反射路径
+	label := make([]byte, 0, 32)
+	for _, d := range detections {
+		c := classColor(d.ClassID)
+		rect := image.Rect(d.BBox[0], d.BBox[1], d.BBox[0]+d.BBox[2], d.BBox[1]+d.BBox[3])
+		gocv.Rectangle(img, rect, c, 2)
+
+		label = append(label[:0], d.Class...)
+		label = append(label, ' ')
+		label = strconv.AppendFloat(label, float64(d.Confidence), 'f', 2, 32)
+		org := image.Pt(d.BBox[0], d.BBox[1]-6)
+		gocv.PutText(img, string(label), org, gocv.FontHersheySimplex, 0.5, c, 1)
+	}
+
+	resultPath := filepath.Join(resultsDir, fmt.Sprintf("result_%d.jpg", time.Now().UnixNano()))
+
+	// JPEG编码和落盘是响应里最贵的CPU/IO段：移到后台协程执行，
+	// 请求在检测结果就绪后立即返回。克隆一份像素数据，
+	// 原Mat在handler返回时关闭也不受影响
+	snapshot := img.Clone()
+	go func() {
+		defer snapshot.Close()
+		if ok := gocv.IMWriteWithParams(resultPath, snapshot, []int{gocv.IMWriteJpegQuality, 95}); !ok {
+			s.logger.Printf("Warning: failed to write result image: %s", resultPath)
+		}
+	}()
+
+	return resultPath, nil
+}
+
+// handleResult 返回标注结果图片
+// http.ServeFile走内核sendfile零拷贝，并自动处理条件请求；
+// 看板轮询同一文件时由页缓存直接命中，无需用户态缓存
+func (s *YOLOServer) handleResult(w http.ResponseWriter, r *http.Request) {
+	if r.Method != http.MethodGet && r.Method != http.MethodHead {
+		http.Error(w, "Method not allowed", http.StatusMethodNotAllowed)
+		return
+	}
+
+	filename := strings.TrimPrefix(r.URL.Path, "/result/")
+	// 只允许访问results目录下的单层文件名，拒绝路径穿越
+	if filename == "" || filename != filepath.Base(filename) {
+		http.Error(w, "Invalid filename", http.StatusBadRequest)
+		return
+	}
+
+	http.ServeFile(w, r, filepath.Join(resultsDir, filename))
+}
+
+// handleHealth 健康检查
+func (s *YOLOServer) handleHealth(w http.ResponseWriter, r *http.Request) {
+	w.Header().Set("Content-Type", "application/json")
+	w.Write(s.healthJSON)
 }
 
 // handleInfo 返回服务信息
 func (s *YOLOServer) handleInfo(w http.ResponseWriter, r *http.Request) {
-	resp := InfoResponse{
+	w.Header().Set("Content-Type", "application/json")
+	w.Write(s.infoJSON)
+}
+
+// buildStaticResponses 预序列化health/info响应：内容在模型加载后
+// 不再变化，健康探测按秒级频率打来时直接写缓存字节，不重复编码
+func (s *YOLOServer) buildStaticResponses() {
+	s.healthJSON, _ = json.Marshal(HealthResponse{
+		Status: "healthy",
+		Model:  s.config.ModelPath,
+	})
+	s.healthJSON = append(s.healthJSON, '\n')
+
+	s.infoJSON, _ = json.Marshal(InfoResponse{
 		ModelType: "yolo",
 		ModelPath: s.config.ModelPath,
 		Version:   "1.0",
 		Loaded:    s.net != nil && !s.net.Empty(),
-	}
-
-	w.Header().Set("Content-Type", "application/json")
-	json.NewEncoder(w).Encode(resp)
+	})
+	s.infoJSON = append(s.infoJSON, '\n')
 }
 
 // decodeImage 解码base64图片
 func (s *YOLOServer) decodeImage(imageData string) (gocv.Mat, error) {
-	// 如果是data URL格式，去掉前缀
+	// 如果是data URL格式，去掉前缀（原地切片，不做Split分配）
 	if strings.HasPrefix(imageData, "data:image") {
-		parts := strings.Split(imageData, ",")
-		if len(parts) == 2 {
-			imageData = parts[1]
+		if idx := strings.IndexByte(imageData, ','); idx >= 0 {
+			imageData = imageData[idx+1:]
 		}
 	}
 
-	// Base64解码
-	imgBytes, err := base64.StdEncoding.DecodeString(imageData)
+	// Base64解码到池化缓冲（IMDecode/标准库解码都会复制数据，
+	// 函数返回后缓冲即可安全回收）
+	need := base64.StdEncoding.DecodedLen(len(imageData))
+	buf, _ := s.b64Pool.Get().([]byte)
+	if cap(buf) < need {
+		buf = make([]byte, need)
+	}
+	defer s.b64Pool.Put(buf)
+
+	n, err := base64.StdEncoding.Decode(buf[:need], []byte(imageData))
 	if err != nil {
 		return gocv.Mat{}, fmt.Errorf("base64 decode failed: %w", err)
 	}
+	imgBytes := buf[:n]
 
-	// 解码为图片
-	img, _, err := image.Decode(strings.NewReader(string(imgBytes)))
-	if err != nil {
-		// 尝试使用GoCV IMDecode
-		mat, err2 := gocv.IMDecode(imgBytes, gocv.IMReadColor)
-		if err2 != nil {
-			return gocv.Mat{}, fmt.Errorf("image decode failed: %w", err)
-		}
+	// 优先使用GoCV IMDecode：单次SIMD解码直接得到BGR Mat，
+	// 避免标准库解码后再做ndarray物化和颜色空间转换
+	mat, err := gocv.IMDecode(imgBytes, gocv.IMReadColor)
+	if err == nil && !mat.Empty() {
 		return mat, nil
 	}
 
-	// 转换为GoCV Mat
-	mat, err := gocv.ImageToMatRGB(img)
+	// 回退到标准库解码（处理IMDecode不支持的格式）
+	img, _, err2 := image.Decode(bytes.NewReader(imgBytes))
+	if err2 != nil {
+		return gocv.Mat{}, fmt.Errorf("image decode failed: %w", err)
+	}
+
+	mat, err = gocv.ImageToMatRGB(img)
 	if err != nil {
 		return gocv.Mat{}, fmt.Errorf("failed to convert to mat: %w", err)
 	}
 
+	// 后续流水线（blob打包的swapRB、结果标注、IMWrite）统一假定BGR，
+	// 回退路径在解码边界就地换到BGR，下游不再出现散落的颜色转换
+	gocv.CvtColor(mat, &mat, gocv.ColorRGBToBGR)
+
 	return mat, nil
 }
 
-// predict 执行YOLO推理
+// predict 执行YOLO推理：请求进入批处理队列，由batchLoop统一执行
+// 模型在main中启动前已加载完成（LoadModel失败则进程不启动），
+// 请求路径上不再重复检查；Empty()是每次进cgo的调用，省去即省去
 func (s *YOLOServer) predict(img *gocv.Mat, confidence, iouThreshold float32) ([]Detection, error) {
-	if s.net == nil || s.net.Empty() {
-		return nil, fmt.Errorf("model not loaded")
+	job := &predictJob{
+		img:    *img,
+		conf:   confidence,
+		iou:    iouThreshold,
+		result: make(chan predictResult, 1),
 	}
+	s.jobs <- job
+	res := <-job.result
+	return res.detections, res.err
+}
 
-	// 预处理图片
-	blob := gocv.BlobFromImage(*img, 1.0/255.0, image.Pt(640, 640), gocv.NewScalar(0, 0, 0, 0), true, false)
+// batchLoop 批处理循环：收到首个请求后，在batchDelay窗口内
+// 最多聚合maxBatchSize个请求，合并为一次前向推理
+func (s *YOLOServer) batchLoop() {
+	// 输入blob与图片切片整个服务生命周期只分配一次：
+	// 批形状稳定后BlobFromImages原地复用底层存储，不再每批cudaMalloc/重新分配
+	blob := gocv.NewMat()
 	defer blob.Close()
+	imgs := make([]gocv.Mat, 0, s.config.MaxBatchSize)
+
+	for job := range s.jobs {
+		batch := []*predictJob{job}
+		timeout := time.After(s.config.BatchDelay)
+	collect:
+		for len(batch) < s.config.MaxBatchSize {
+			select {
+			case j := <-s.jobs:
+				batch = append(batch, j)
+			case <-timeout:
+				break collect
+			}
+		}
 
-	// 设置输入
-	s.net.SetInput(blob, "")
+		imgs = imgs[:0]
+		for _, j := range batch {
+			imgs = append(imgs, j.img)
+		}
+		s.runBatch(batch, imgs, &blob)
+	}
+}
+
+// runBatch 对一批图片执行单次前向推理，并将结果分发回各请求
+func (s *YOLOServer) runBatch(batch []*predictJob, imgs []gocv.Mat, blob *gocv.Mat) {
+	// 预处理：整批图片打包为一个blob，单次SetInput/Forward。
+	// BlobFromImages在一趟原生代码里融合了resize、1/255归一化、
+	// BGR→RGB通道交换和NCHW重排，中间不物化任何临时图像
+	gocv.BlobFromImages(imgs, blob, 1.0/255.0, s.inputSize, s.blobMean, true, false, gocv.MatTypeCV32F)
 
-	// 前向推理
+	s.net.SetInput(*blob, "")
 	output := s.net.Forward("")
 	defer output.Close()
 
-	// 解析输出
-	detections := s.parseYOLOOutput(&output, img.Cols(), img.Rows(), confidence, iouThreshold)
-
-	return detections, nil
-}
-
-// parseYOLOOutput 解析YOLO输出
-func (s *YOLOServer) parseYOLOOutput(output *gocv.Mat, imgWidth, imgHeight int, confThreshold, iouThreshold float32) []Detection {
-	// 获取输出数据
-	data, _ := output.DataPtrFloat32()
-	if len(data) == 0 {
+	// 输出张量一次性取出为float32切片：整批只跨一次cgo边界，
+	// 后续解析是纯Go的内存遍历，不存在逐框、逐字段的按元素读取
+	data, err := output.DataPtrFloat32()
+	if err != nil || len(data) == 0 {
 		s.logger.Println("Warning: Empty output from model")
-		return []Detection{}
+		for _, j := range batch {
+			j.result <- predictResult{err: fmt.Errorf("empty model output")}
+		}
+		return
 	}
 
+	// 输出按图片等分，逐张解析
+	per := len(data) / len(batch)
+	for i, j := range batch {
+		dets := s.parseYOLOOutput(data[i*per:(i+1)*per], j.img.Cols(), j.img.Rows(), j.conf, j.iou)
+		j.result <- predictResult{detections: dets}
+	}
+}
+
+// parseYOLOOutput 解析单张图片的YOLO输出
+func (s *YOLOServer) parseYOLOOutput(data []float32, imgWidth, imgHeight int, confThreshold, iouThreshold float32) []Detection {
 	// 计算行数和列数
-	rows := int(output.Total()) / 85 // YOLO输出格式: [x, y, w, h, conf, class_scores...]
+	const rowSize = 5 + numClasses
+	rows := len(data) / rowSize
 
-	s.logger.Printf("Output shape: rows=%d, total=%d", rows, output.Total())
+	// 复用上次推理的候选框缓冲（容量保留，长度清零）
+	boxes := s.scratchBoxes[:0]
+	confidences := s.scratchConfs[:0]
+	classIDs := s.scratchClassIDs[:0]
 
-	var boxes []image.Rectangle
-	var confidences []float32
-	var classIDs []int
+	// 坐标缩放因子在循环外计算一次
+	fw := float32(imgWidth)
+	fh := float32(imgHeight)
 
 	// 解析每个检测
 	for i := 0; i < rows; i++ {
-		offset := i * 85
+		offset := i * rowSize
 
 		// 获置信度
 		confidence := data[offset+4]
@@ -293,46 +1140,69 @@ func (s *YOLOServer) parseYOLOOutput(output *gocv.Mat, imgWidth, imgHeight int,
 			continue
 		}
 
-		// 获取类别分数
-		classScores := data[offset+5 : offset+85]
-		classID := argmax(classScores)
-		classScore := classScores[classID]
+		// 类别分数argmax内联到行扫描里，单遍顺序访问，
+		// 不再为每行构造子切片和函数调用
+		classID := 0
+		classScore := data[offset+5]
+		for c := 1; c < numClasses; c++ {
+			if v := data[offset+5+c]; v > classScore {
+				classScore = v
+				classID = c
+			}
+		}
 
 		finalConf := confidence * classScore
 		if finalConf < confThreshold {
 			continue
 		}
 
-		// 获取边界框（归一化坐标）
-		x := data[offset+0]
-		y := data[offset+1]
-		w := data[offset+2]
-		h := data[offset+3]
-
-		// 转换为像素坐标
-		left := int((x - w/2) * float32(imgWidth))
-		top := int((y - h/2) * float32(imgHeight))
-		width := int(w * float32(imgWidth))
-		height := int(h * float32(imgHeight))
+		// 中心坐标转像素角点：每个缩放量只算一次，
+		// 宽高的像素值直接复用在角点计算里
+		width := data[offset+2] * fw
+		height := data[offset+3] * fh
+		left := int(data[offset+0]*fw - 0.5*width)
+		top := int(data[offset+1]*fh - 0.5*height)
 
-		boxes = append(boxes, image.Rect(left, top, left+width, top+height))
+		boxes = append(boxes, image.Rect(left, top, left+int(width), top+int(height)))
 		confidences = append(confidences, finalConf)
 		classIDs = append(classIDs, classID)
 	}
 
+	// 归还扩容后的缓冲，供下次推理复用
+	s.scratchBoxes = boxes
+	s.scratchConfs = confidences
+	s.scratchClassIDs = classIDs
+
 	// 应用NMS
 	if len(boxes) == 0 {
 		return []Detection{}
 	}
 
-	indices := gocv.NMSBoxes(boxes, confidences, confThreshold, iouThreshold)
+	// 类别感知NMS：按类别ID把框平移到互不重叠的坐标区间后，
+	// 单次NMSBoxes调用覆盖全部类别，类别之间不会互相抑制。
+	// 区间宽度按实际图片尺寸推导（留2倍余量容纳越出图片边界的框），
+	// 固定常量在超大图上会让相邻类别区间重叠、重新引入跨类抑制
+	classStride := imgWidth
+	if imgHeight > classStride {
+		classStride = imgHeight
+	}
+	classStride *= 2
+	shifted := s.scratchShift[:0]
+	for i, b := range boxes {
+		off := classIDs[i] * classStride
+		shifted = append(shifted, b.Add(image.Pt(off, off)))
+	}
+	s.scratchShift = shifted
+
+	indices := gocv.NMSBoxes(shifted, confidences, confThreshold, iouThreshold)
 
-	// 构建最终结果
-	var detections []Detection
+	// 构建最终结果（数量已知，一次性分配）
+	detections := make([]Detection, 0, len(indices))
 	for _, idx := range indices {
 		box := boxes[idx]
 		detections = append(detections, Detection{
-			Class:      fmt.Sprintf("class_%d", classIDs[idx]),
+			Class:      className(classIDs[idx]),
+			ClassID:    classIDs[idx],
 			Confidence: confidences[idx],
 			BBox:       [4]int{box.Min.X, box.Min.Y, box.Dx(), box.Dy()},
 		})
@@ -341,25 +1211,6 @@ func (s *YOLOServer) parseYOLOOutput(output *gocv.Mat, imgWidth, imgHeight int,
 	return detections
 }
 
-// argmax 返回最大值的索引
-func argmax(data []float32) int {
-	if len(data) == 0 {
-		return -1
-	}
-
-	maxIdx := 0
-	maxVal := data[0]
-
-	for i := 1; i < len(data); i++ {
-		if data[i] > maxVal {
-			maxVal = data[i]
-			maxIdx = i
-		}
-	}
-
-	return maxIdx
-}
-
 // 支持从文件上传的handlePredictFile
 func (s *YOLOServer) handlePredictFile(w http.ResponseWriter, r *http.Request) {
 	if r.Method != http.MethodPost {
@@ -389,8 +1240,10 @@ func (s *YOLOServer) handlePredictFile(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
-	// 解码图片
+	// 解码图片（受decodeSem限流）
+	s.decodeSem <- struct{}{}
 	img, err := gocv.IMDecode(imgBytes, gocv.IMReadColor)
+	<-s.decodeSem
 	if err != nil {
 		http.Error(w, "Failed to decode image", http.StatusBadRequest)
 		return
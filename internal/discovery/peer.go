@@ -45,12 +45,19 @@ func NewPeerDiscovery(logger *logrus.Logger, reg *register.Register, peerAddrs [
 
 // Start 启动peer发现
 func (d *PeerDiscovery) Start() error {
-	// 注册到所有peer节点
+	// 并发注册到所有peer节点：各节点互不依赖，
+	// 总耗时由最慢的一个决定，而不是所有节点串行相加
+	var wg sync.WaitGroup
 	for _, peerAddr := range d.peerAddrs {
-		if err := d.registerToPeer(peerAddr); err != nil {
-			d.logger.WithError(err).WithField("peer_addr", peerAddr).Warn("Failed to register to peer")
-		}
+		wg.Add(1)
+		go func(peerAddr string) {
+			defer wg.Done()
+			if err := d.registerToPeer(peerAddr); err != nil {
+				d.logger.WithError(err).WithField("peer_addr", peerAddr).Warn("Failed to register to peer")
+			}
+		}(peerAddr)
 	}
+	wg.Wait()
 
 	// 启动peer信息同步
 	go d.syncLoop()
@@ -64,12 +71,18 @@ func (d *PeerDiscovery) Start() error {
 func (d *PeerDiscovery) Stop() error {
 	d.cancel()
 
-	// 从所有peer节点注销
+	// 并发从所有peer节点注销
+	var wg sync.WaitGroup
 	for _, peerAddr := range d.peerAddrs {
-		if err := d.unregisterFromPeer(peerAddr); err != nil {
-			d.logger.WithError(err).WithField("peer_addr", peerAddr).Warn("Failed to unregister from peer")
-		}
+		wg.Add(1)
+		go func(peerAddr string) {
+			defer wg.Done()
+			if err := d.unregisterFromPeer(peerAddr); err != nil {
+				d.logger.WithError(err).WithField("peer_addr", peerAddr).Warn("Failed to unregister from peer")
+			}
+		}(peerAddr)
 	}
+	wg.Wait()
 
 	d.logger.Info("Peer discovery stopped")
 	return nil
@@ -147,13 +160,24 @@ func (d *PeerDiscovery) syncLoop() {
 	}
 }
 
-// syncWithPeers 与peer节点同步
+// syncWithPeers 与peer节点同步（并发拉取，慢节点不阻塞其他节点的同步）
 func (d *PeerDiscovery) syncWithPeers() {
-	for _, peerAddr := range d.peerAddrs {
-		if err := d.syncWithPeer(peerAddr); err != nil {
-			d.logger.WithError(err).WithField("peer_addr", peerAddr).Debug("Failed to sync with peer")
-		}
-	}
+	d.mu.RLock()
+	peerAddrs := make([]string, len(d.peerAddrs))
+	copy(peerAddrs, d.peerAddrs)
+	d.mu.RUnlock()
+
+	var wg sync.WaitGroup
+	for _, peerAddr := range peerAddrs {
+		wg.Add(1)
+		go func(peerAddr string) {
+			defer wg.Done()
+			if err := d.syncWithPeer(peerAddr); err != nil {
+				d.logger.WithError(err).WithField("peer_addr", peerAddr).Debug("Failed to sync with peer")
+			}
+		}(peerAddr)
+	}
+	wg.Wait()
 }
 
 // syncWithPeer 与单个peer节点同步
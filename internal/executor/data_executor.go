@@ -18,6 +18,7 @@ import (
 type DataExecutor struct {
 	storageManager *storage.StorageManager
 	logger         *logrus.Logger
+	httpClient     *http.Client // 复用连接的下载客户端
 }
 
 // NewDataExecutor 创建数据执行器
@@ -25,6 +26,8 @@ func NewDataExecutor(storageManager *storage.StorageManager, logger *logrus.Logg
 	return &DataExecutor{
 		storageManager: storageManager,
 		logger:         logger,
+		// 下载大小不可预估，不设整体超时；取消通过请求ctx传递
+		httpClient: &http.Client{},
 	}
 }
 
@@ -165,8 +168,12 @@ func (e *DataExecutor) handleURLDownload(ctx context.Context, data *workload.Dat
 		"url":      data.SourceURL,
 	}).Info("开始从URL下载数据")
 
-	// 下载文件
-	resp, err := http.Get(data.SourceURL)
+	// 下载文件（共享客户端复用连接池，同主机多次下载免去握手开销）
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, data.SourceURL, nil)
+	if err != nil {
+		return fmt.Errorf("failed to build download request: %w", err)
+	}
+	resp, err := e.httpClient.Do(req)
 	if err != nil {
 		return fmt.Errorf("failed to download from URL: %w", err)
 	}
@@ -244,10 +251,12 @@ func (e *DataExecutor) handleLocalPath(ctx context.Context, data *workload.DataW
 		data.FilePath = filepath.Join("/tmp/cnet_data", data.GetDataKey(), fileName)
 	}
 
-	// 复制文件
-	err = e.copyFile(data.SourcePath, data.FilePath)
-	if err != nil {
-		return fmt.Errorf("failed to copy file: %w", err)
+	// 复制文件（源路径已是目标路径时跳过，避免整份重写）
+	if data.SourcePath != data.FilePath {
+		err = e.copyFile(data.SourcePath, data.FilePath)
+		if err != nil {
+			return fmt.Errorf("failed to copy file: %w", err)
+		}
 	}
 
 	// 计算文件hash
@@ -16,9 +16,10 @@ import (
 
 // DataGatewayExecutor 提供只读S3子集的网关服务
 type DataGatewayExecutor struct {
-	logger  *logrus.Logger
-	mu      sync.RWMutex
-	servers map[string]*gatewayServer // workload_id -> server
+	logger     *logrus.Logger
+	mu         sync.RWMutex
+	servers    map[string]*gatewayServer // workload_id -> server
+	httpClient *http.Client              // 复用连接的健康检查客户端
 }
 
 type gatewayServer struct {
@@ -32,7 +33,11 @@ type gatewayServer struct {
 }
 
 func NewDataGatewayExecutor(logger *logrus.Logger) *DataGatewayExecutor {
-	return &DataGatewayExecutor{logger: logger, servers: make(map[string]*gatewayServer)}
+	return &DataGatewayExecutor{
+		logger:     logger,
+		servers:    make(map[string]*gatewayServer),
+		httpClient: &http.Client{Timeout: 5 * time.Second},
+	}
 }
 
 func (e *DataGatewayExecutor) Init(ctx context.Context) error {
@@ -147,7 +152,7 @@ func (e *DataGatewayExecutor) HealthCheck(ctx context.Context, workloadID string
 		return fmt.Errorf("gateway not found: %s", workloadID)
 	}
 	req, _ := http.NewRequestWithContext(ctx, http.MethodGet, gs.endpoint+"/health", nil)
-	resp, err := http.DefaultClient.Do(req)
+	resp, err := e.httpClient.Do(req)
 	if err != nil {
 		return err
 	}
@@ -161,7 +166,7 @@ func (e *DataGatewayExecutor) HealthCheck(ctx context.Context, workloadID string
 func (e *DataGatewayExecutor) waitHealthy(endpoint string, timeout time.Duration) error {
 	deadline := time.Now().Add(timeout)
 	for time.Now().Before(deadline) {
-		resp, err := http.Get(endpoint + "/health")
+		resp, err := e.httpClient.Get(endpoint + "/health")
 		if err == nil && resp.StatusCode == http.StatusOK {
 			resp.Body.Close()
 			return nil
@@ -17,9 +17,10 @@ import (
 // OpenCVInferenceExecutor OpenCV推理服务执行器
 // 管理OpenCV HTTP推理服务进程
 type OpenCVInferenceExecutor struct {
-	logger   *logrus.Logger
-	mu       sync.RWMutex
-	services map[string]*OpenCVService // workload_id -> service
+	logger     *logrus.Logger
+	mu         sync.RWMutex
+	services   map[string]*OpenCVService // workload_id -> service
+	httpClient *http.Client              // 复用连接的健康检查客户端
 }
 
 // OpenCVService OpenCV推理服务实例
@@ -34,6 +35,7 @@ type OpenCVService struct {
 	restartCount    int
 	ctx             context.Context
 	cancel          context.CancelFunc
+	exited          chan struct{} // 后台Wait回收子进程后关闭
 }
 
 // NewOpenCVInferenceExecutor 创建OpenCV推理执行器
@@ -41,6 +43,9 @@ func NewOpenCVInferenceExecutor(logger *logrus.Logger) *OpenCVInferenceExecutor
 	return &OpenCVInferenceExecutor{
 		logger:   logger,
 		services: make(map[string]*OpenCVService),
+		httpClient: &http.Client{
+			Timeout: 5 * time.Second,
+		},
 	}
 }
 
@@ -127,6 +132,14 @@ func (e *OpenCVInferenceExecutor) startService(ctx context.Context, ow *workload
 		return nil, fmt.Errorf("failed to start process: %w", err)
 	}
 
+	// 后台回收子进程：没有Wait的话崩溃的子进程会一直是僵尸，
+	// kill(pid, 0)仍然成功，就绪等待无法察觉进程已死
+	exited := make(chan struct{})
+	go func() {
+		cmd.Wait()
+		close(exited)
+	}()
+
 	service := &OpenCVService{
 		workloadID:   ow.GetID(),
 		cascadeType:  ow.CascadeType,
@@ -136,6 +149,7 @@ func (e *OpenCVInferenceExecutor) startService(ctx context.Context, ow *workload
 		restartCount: 0,
 		ctx:          serviceCtx,
 		cancel:       cancel,
+		exited:       exited,
 	}
 
 	// 等待服务启动（健康检查）
@@ -148,15 +162,29 @@ func (e *OpenCVInferenceExecutor) startService(ctx context.Context, ow *workload
 	return service, nil
 }
 
-// waitForService 等待服务启动
+// waitForService 等待服务就绪：小间隔起步指数退避，快启动的服务
+// 只等百毫秒级；子进程已退出时立即失败，不再盲等满整个超时窗口
 func (e *OpenCVInferenceExecutor) waitForService(service *OpenCVService, timeout time.Duration) error {
 	deadline := time.Now().Add(timeout)
+	delay := 100 * time.Millisecond
 
 	for time.Now().Before(deadline) {
 		if err := e.checkServiceHealth(service); err == nil {
 			return nil
 		}
-		time.Sleep(500 * time.Millisecond)
+		// 进程已死则健康检查永远不会通过，直接报错
+		select {
+		case <-service.exited:
+			return fmt.Errorf("service process exited before becoming ready")
+		default:
+		}
+		time.Sleep(delay)
+		if delay < time.Second {
+			delay = delay * 3 / 2
+			if delay > time.Second {
+				delay = time.Second
+			}
+		}
 	}
 
 	return fmt.Errorf("service did not start within timeout")
@@ -164,7 +192,7 @@ func (e *OpenCVInferenceExecutor) waitForService(service *OpenCVService, timeout
 
 // checkServiceHealth 检查服务健康状态
 func (e *OpenCVInferenceExecutor) checkServiceHealth(service *OpenCVService) error {
-	resp, err := http.Get(service.endpoint + "/health")
+	resp, err := e.httpClient.Get(service.endpoint + "/health")
 	if err != nil {
 		return err
 	}
@@ -258,7 +286,8 @@ func (e *OpenCVInferenceExecutor) Stop(ctx context.Context, w workload.Workload)
 		if err := service.process.Process.Kill(); err != nil {
 			e.logger.WithError(err).Warn("Failed to kill process")
 		}
-		service.process.Wait() // 等待进程退出
+		// 子进程由启动时的后台Wait回收，这里等它完成
+		<-service.exited
 	}
 
 	// 清理
@@ -2,11 +2,13 @@ package executor
 
 import (
 	"bufio"
+	"bytes"
 	"context"
 	"fmt"
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"syscall"
 
 	"cnet/internal/workload"
@@ -143,6 +145,7 @@ func (e *ProcessExecutor) Stop(ctx context.Context, w workload.Workload) error {
 }
 
 // GetLogs 获取进程日志
+// 只需最后N行时从文件尾部按块回读，日志增长后开销不随文件总大小线性上升
 func (e *ProcessExecutor) GetLogs(ctx context.Context, w workload.Workload, lines int) ([]string, error) {
 	logFile, exists := e.logFiles[w.GetID()]
 	if !exists {
@@ -155,19 +158,53 @@ func (e *ProcessExecutor) GetLogs(ctx context.Context, w workload.Workload, line
 	}
 	defer file.Close()
 
-	// 读取最后N行
-	var logLines []string
-	scanner := bufio.NewScanner(file)
-	for scanner.Scan() {
-		logLines = append(logLines, scanner.Text())
+	// 不限行数时保持整文件读取
+	if lines <= 0 {
+		var logLines []string
+		scanner := bufio.NewScanner(file)
+		for scanner.Scan() {
+			logLines = append(logLines, scanner.Text())
+		}
+		if err := scanner.Err(); err != nil {
+			return nil, fmt.Errorf("failed to read log file: %w", err)
+		}
+		return logLines, nil
+	}
+
+	fi, err := file.Stat()
+	if err != nil {
+		return nil, fmt.Errorf("failed to stat log file: %w", err)
 	}
 
-	if err := scanner.Err(); err != nil {
-		return nil, fmt.Errorf("failed to read log file: %w", err)
+	// 从尾部逐块向前读取，直到凑够N行或到达文件头
+	const chunkSize = 64 * 1024
+	var tail []byte
+	offset := fi.Size()
+
+	for offset > 0 {
+		readSize := int64(chunkSize)
+		if offset < readSize {
+			readSize = offset
+		}
+		offset -= readSize
+
+		chunk := make([]byte, readSize)
+		if _, err := file.ReadAt(chunk, offset); err != nil {
+			return nil, fmt.Errorf("failed to read log file: %w", err)
+		}
+		tail = append(chunk, tail...)
+
+		// 已覆盖的换行数足够N行即可停止回读
+		if bytes.Count(tail, []byte{'\n'}) > lines {
+			break
+		}
 	}
 
-	// 返回最后N行
-	if lines > 0 && len(logLines) > lines {
+	logLines := strings.Split(strings.TrimRight(string(tail), "\n"), "\n")
+	if len(logLines) == 1 && logLines[0] == "" {
+		return []string{}, nil
+	}
+	if len(logLines) > lines {
 		logLines = logLines[len(logLines)-lines:]
 	}
 
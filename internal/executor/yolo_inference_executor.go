@@ -17,9 +17,10 @@ import (
 // YOLOInferenceExecutor YOLO模型推理服务执行器
 // 管理YOLO HTTP推理服务进程
 type YOLOInferenceExecutor struct {
-	logger   *logrus.Logger
-	mu       sync.RWMutex
-	services map[string]*YOLOService // workload_id -> service
+	logger     *logrus.Logger
+	mu         sync.RWMutex
+	services   map[string]*YOLOService // workload_id -> service
+	httpClient *http.Client            // 复用连接的健康检查客户端
 }
 
 // YOLOService YOLO推理服务实例
@@ -35,6 +36,7 @@ type YOLOService struct {
 	restartCount    int
 	ctx             context.Context
 	cancel          context.CancelFunc
+	exited          chan struct{} // 后台Wait回收子进程后关闭
 }
 
 // NewYOLOInferenceExecutor 创建YOLO执行器
@@ -42,6 +44,9 @@ func NewYOLOInferenceExecutor(logger *logrus.Logger) *YOLOInferenceExecutor {
 	return &YOLOInferenceExecutor{
 		logger:   logger,
 		services: make(map[string]*YOLOService),
+		httpClient: &http.Client{
+			Timeout: 5 * time.Second,
+		},
 	}
 }
 
@@ -98,6 +103,14 @@ func (e *YOLOInferenceExecutor) startService(ctx context.Context, mw *workload.M
 	if mw.ModelConfig != "" {
 		cmd.Args = append(cmd.Args, "--config", mw.ModelConfig)
 	}
+	// 把加速配置透传给推理服务，workload可按部署环境选择
+	// cuda/cudafp16等后端，而不是固定跑CPU路径
+	if mw.Backend != "" {
+		cmd.Args = append(cmd.Args, "--backend", mw.Backend)
+	}
+	if mw.Target != "" {
+		cmd.Args = append(cmd.Args, "--target", mw.Target)
+	}
 	cmd.Dir = "."
 	logFile := fmt.Sprintf("yolo_service_%d.log", mw.ServicePort)
 	outFile, err := os.Create(logFile)
@@ -113,6 +126,14 @@ func (e *YOLOInferenceExecutor) startService(ctx context.Context, mw *workload.M
 		return nil, fmt.Errorf("failed to start process: %w", err)
 	}
 
+	// 后台回收子进程：没有Wait的话崩溃的子进程会一直是僵尸，
+	// kill(pid, 0)仍然成功，就绪等待无法察觉进程已死
+	exited := make(chan struct{})
+	go func() {
+		cmd.Wait()
+		close(exited)
+	}()
+
 	service := &YOLOService{
 		workloadID:   mw.GetID(),
 		modelPath:    mw.ModelPath,
@@ -123,6 +144,7 @@ func (e *YOLOInferenceExecutor) startService(ctx context.Context, mw *workload.M
 		restartCount: 0,
 		ctx:          serviceCtx,
 		cancel:       cancel,
+		exited:       exited,
 	}
 	if err := e.waitForService(service, 60*time.Second); err != nil {
 		cmd.Process.Kill()
@@ -132,19 +154,34 @@ func (e *YOLOInferenceExecutor) startService(ctx context.Context, mw *workload.M
 	return service, nil
 }
 
+// waitForService 等待服务就绪：小间隔起步指数退避，快启动的服务
+// 只等百毫秒级；子进程已退出时立即失败，不再盲等满整个超时窗口
 func (e *YOLOInferenceExecutor) waitForService(service *YOLOService, timeout time.Duration) error {
 	deadline := time.Now().Add(timeout)
+	delay := 100 * time.Millisecond
 	for time.Now().Before(deadline) {
 		if err := e.checkServiceHealth(service); err == nil {
 			return nil
 		}
-		time.Sleep(1 * time.Second)
+		// 进程已死则健康检查永远不会通过，直接报错
+		select {
+		case <-service.exited:
+			return fmt.Errorf("service process exited before becoming ready")
+		default:
+		}
+		time.Sleep(delay)
+		if delay < time.Second {
+			delay = delay * 3 / 2
+			if delay > time.Second {
+				delay = time.Second
+			}
+		}
 	}
 	return fmt.Errorf("service did not start within timeout")
 }
 
 func (e *YOLOInferenceExecutor) checkServiceHealth(service *YOLOService) error {
-	resp, err := http.Get(service.endpoint + "/health")
+	resp, err := e.httpClient.Get(service.endpoint + "/health")
 	if err != nil {
 		return err
 	}
@@ -210,7 +247,8 @@ func (e *YOLOInferenceExecutor) Stop(ctx context.Context, w workload.Workload) e
 		if err := service.process.Process.Kill(); err != nil {
 			e.logger.WithError(err).Warn("Failed to kill YOLO process")
 		}
-		service.process.Wait()
+		// 子进程由启动时的后台Wait回收，这里等它完成
+		<-service.exited
 	}
 	delete(e.services, w.GetID())
 	w.SetStatus(workload.StatusStopped)
@@ -249,16 +249,17 @@ func (a *API) handleDataWorkloadUpload(w http.ResponseWriter, r *http.Request) {
 
 	hasher := md5.New()
 	tee := io.TeeReader(file, hasher)
-	tmpDir := os.TempDir()
-	tmpPath := filepath.Join(tmpDir, "cnet_uploads", dataKey)
-	if err := os.MkdirAll(tmpPath, 0755); err != nil {
-		a.writeError(w, http.StatusInternalServerError, "Failed to create temp dir", err)
+	// 直接写入最终持久化目录：执行器看到源路径即目标路径时跳过复制，
+	// 上传文件只落盘一次
+	finalDir := filepath.Join("/tmp/cnet_data", dataKey)
+	if err := os.MkdirAll(finalDir, 0755); err != nil {
+		a.writeError(w, http.StatusInternalServerError, "Failed to create data dir", err)
 		return
 	}
-	dstPath := filepath.Join(tmpPath, header.Filename)
+	dstPath := filepath.Join(finalDir, header.Filename)
 	out, err := os.Create(dstPath)
 	if err != nil {
-		a.writeError(w, http.StatusInternalServerError, "Failed to create temp file", err)
+		a.writeError(w, http.StatusInternalServerError, "Failed to create data file", err)
 		return
 	}
 	if _, err := io.Copy(out, tee); err != nil {
@@ -289,7 +290,7 @@ func (a *API) handleDataWorkloadUpload(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	// 最终持久化路径（与执行器保持一致）
-	finalPath := filepath.Join("/tmp/cnet_data", dataKey, header.Filename)
+	finalPath := dstPath
 
 	a.writeJSON(w, http.StatusCreated, map[string]interface{}{
 		"workload": wl,
@@ -195,8 +195,8 @@ func (m *Manager) GetWorkloadLogs(ctx context.Context, workloadID string, lines
 // GetResourceStats 获取资源统计信息
 func (m *Manager) GetResourceStats() map[string]interface{} {
 	localRes := m.register.GetLocalResources()
-	childNodes := m.register.GetChildNodes()
-	peerNodes := m.register.GetPeerNodes()
+	// 统计只需要数量，避免为计数复制整份节点列表
+	childCount, peerCount := m.register.NodeCounts()
 	workloads := m.ListWorkloads()
 
 	stats := map[string]interface{}{
@@ -205,8 +205,8 @@ func (m *Manager) GetResourceStats() map[string]interface{} {
 			"available": localRes.Available,
 			"used":      localRes.Used,
 		},
-		"child_nodes_count": len(childNodes),
-		"peer_nodes_count":  len(peerNodes),
+		"child_nodes_count": childCount,
+		"peer_nodes_count":  peerCount,
 		"workloads_count":   len(workloads),
 	}
 
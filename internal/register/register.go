@@ -339,6 +339,13 @@ func (r *Register) GetChildNodes() []*NodeResources {
 	return nodes
 }
 
+// NodeCounts 返回下级和peer节点数量（只读计数，不复制节点数据）
+func (r *Register) NodeCounts() (children, peers int) {
+	r.mu.RLock()
+	defer r.mu.RUnlock()
+	return len(r.childNodes), len(r.peerNodes)
+}
+
 // GetPeerNodes 获取所有同级节点
 func (r *Register) GetPeerNodes() []*NodeResources {
 	r.mu.RLock()
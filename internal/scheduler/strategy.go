@@ -68,13 +68,17 @@ func (s *DefaultScheduleStrategy) MakeDecision(reg *register.Register, req regis
 type BestFitStrategy struct{}
 
 // MakeDecision 实现最佳适配调度
+// 遍历时只记录最优节点的标量信息（action/node/score），
+// 最终决策对象只构造一次，避免为每个候选节点分配决策结构
 func (s *BestFitStrategy) MakeDecision(reg *register.Register, req register.ResourceRequirements) *ScheduleDecision {
-	type candidate struct {
-		decision *ScheduleDecision
-		score    float64 // 资源匹配度分数，越小越好
-	}
-
-	var best *candidate
+	var (
+		found        bool
+		bestScore    float64
+		bestAction   string
+		bestNodeID   string
+		bestNodeAddr string
+		bestReason   string
+	)
 
 	// 计算资源匹配分数
 	calcScore := func(available register.Resources) float64 {
@@ -87,16 +91,12 @@ func (s *BestFitStrategy) MakeDecision(reg *register.Register, req register.Reso
 	// 检查本地资源
 	localRes := reg.GetLocalResources()
 	if localRes.Available.CanSatisfy(req) {
-		score := calcScore(localRes.Available)
-		best = &candidate{
-			decision: &ScheduleDecision{
-				Action:   "local",
-				NodeID:   localRes.NodeID,
-				NodeAddr: localRes.Address,
-				Reason:   "Best fit: local resources",
-			},
-			score: score,
-		}
+		found = true
+		bestScore = calcScore(localRes.Available)
+		bestAction = "local"
+		bestNodeID = localRes.NodeID
+		bestNodeAddr = localRes.Address
+		bestReason = "Best fit: local resources"
 	}
 
 	// 检查下级节点
@@ -104,16 +104,13 @@ func (s *BestFitStrategy) MakeDecision(reg *register.Register, req register.Reso
 	for _, node := range childNodes {
 		if node.Status == "active" && node.Available.CanSatisfy(req) {
 			score := calcScore(node.Available)
-			if best == nil || score < best.score {
-				best = &candidate{
-					decision: &ScheduleDecision{
-						Action:   "delegate_child",
-						NodeID:   node.NodeID,
-						NodeAddr: node.Address,
-						Reason:   "Best fit: child node",
-					},
-					score: score,
-				}
+			if !found || score < bestScore {
+				found = true
+				bestScore = score
+				bestAction = "delegate_child"
+				bestNodeID = node.NodeID
+				bestNodeAddr = node.Address
+				bestReason = "Best fit: child node"
 			}
 		}
 	}
@@ -123,22 +120,24 @@ func (s *BestFitStrategy) MakeDecision(reg *register.Register, req register.Reso
 	for _, node := range peerNodes {
 		if node.Status == "active" && node.Available.CanSatisfy(req) {
 			score := calcScore(node.Available)
-			if best == nil || score < best.score {
-				best = &candidate{
-					decision: &ScheduleDecision{
-						Action:   "delegate_peer",
-						NodeID:   node.NodeID,
-						NodeAddr: node.Address,
-						Reason:   "Best fit: peer node",
-					},
-					score: score,
-				}
+			if !found || score < bestScore {
+				found = true
+				bestScore = score
+				bestAction = "delegate_peer"
+				bestNodeID = node.NodeID
+				bestNodeAddr = node.Address
+				bestReason = "Best fit: peer node"
 			}
 		}
 	}
 
-	if best != nil {
-		return best.decision
+	if found {
+		return &ScheduleDecision{
+			Action:   bestAction,
+			NodeID:   bestNodeID,
+			NodeAddr: bestNodeAddr,
+			Reason:   bestReason,
+		}
 	}
 
 	return &ScheduleDecision{
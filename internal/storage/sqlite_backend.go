@@ -21,6 +21,10 @@ import (
 type SQLiteBackend struct {
 	db       *sql.DB
 	dataPath string
+
+	// 热路径查询的预编译语句（解析一次，多次执行）
+	existsStmt *sql.Stmt
+	infoStmt   *sql.Stmt
 }
 
 // NewSQLiteBackend 创建SQLite存储后端
@@ -36,6 +40,18 @@ func NewSQLiteBackend(dbPath, dataPath string) (*SQLiteBackend, error) {
 		return nil, fmt.Errorf("failed to open database: %w", err)
 	}
 
+	// WAL模式下读写不互斥，NORMAL同步级别减少每次提交的fsync开销
+	pragmas := []string{
+		"PRAGMA journal_mode=WAL",
+		"PRAGMA synchronous=NORMAL",
+	}
+	for _, pragma := range pragmas {
+		if _, err := db.Exec(pragma); err != nil {
+			db.Close()
+			return nil, fmt.Errorf("failed to set pragma: %w", err)
+		}
+	}
+
 	backend := &SQLiteBackend{
 		db:       db,
 		dataPath: dataPath,
@@ -47,9 +63,36 @@ func NewSQLiteBackend(dbPath, dataPath string) (*SQLiteBackend, error) {
 		return nil, fmt.Errorf("failed to initialize tables: %w", err)
 	}
 
+	// 预编译热路径语句
+	if err := backend.prepareStatements(); err != nil {
+		db.Close()
+		return nil, fmt.Errorf("failed to prepare statements: %w", err)
+	}
+
 	return backend, nil
 }
 
+// prepareStatements 预编译高频查询语句，避免每次调用重新解析SQL
+func (s *SQLiteBackend) prepareStatements() error {
+	var err error
+
+	s.existsStmt, err = s.db.Prepare("SELECT 1 FROM objects WHERE data_key = ? LIMIT 1")
+	if err != nil {
+		return err
+	}
+
+	s.infoStmt, err = s.db.Prepare(`
+	SELECT data_key, name, data_type, content_type, size, hash,
+		   file_path, directory_path, file_count, access_mode,
+		   tags, metadata, created_at, updated_at
+	FROM objects WHERE data_key = ?`)
+	if err != nil {
+		return err
+	}
+
+	return nil
+}
+
 // initTables 初始化数据库表
 func (s *SQLiteBackend) initTables() error {
 	// 创建数据对象表
@@ -144,14 +187,20 @@ func (s *SQLiteBackend) Upload(ctx context.Context, data *workload.DataWorkload)
 			return fmt.Errorf("failed to delete old file records: %w", err)
 		}
 
-		// 插入新的文件记录
+		// 插入新的文件记录（语句只编译一次，循环内重复执行）
 		insertFile := `
 		INSERT INTO object_files (
 			data_key, file_path, file_size, file_hash, content_type, last_modified
 		) VALUES (?, ?, ?, ?, ?, ?)`
 
+		fileStmt, err := tx.PrepareContext(ctx, insertFile)
+		if err != nil {
+			return fmt.Errorf("failed to prepare file insert: %w", err)
+		}
+		defer fileStmt.Close()
+
 		for _, file := range data.FileList {
-			_, err = tx.Exec(insertFile,
+			_, err = fileStmt.Exec(
 				data.DataKey, file.Path, file.Size, file.Hash,
 				file.ContentType, file.LastModified)
 			if err != nil {
@@ -233,17 +282,11 @@ func (s *SQLiteBackend) Delete(ctx context.Context, data *workload.DataWorkload)
 
 // GetInfo 获取数据信息
 func (s *SQLiteBackend) GetInfo(ctx context.Context, data *workload.DataWorkload) (*DataInfo, error) {
-	query := `
-	SELECT data_key, name, data_type, content_type, size, hash,
-		   file_path, directory_path, file_count, access_mode,
-		   tags, metadata, created_at, updated_at
-	FROM objects WHERE data_key = ?`
-
 	var info DataInfo
 	var tagsJSON, metadataJSON string
 	var createdAt, updatedAt time.Time
 
-	err := s.db.QueryRowContext(ctx, query, data.DataKey).Scan(
+	err := s.infoStmt.QueryRowContext(ctx, data.DataKey).Scan(
 		&info.DataKey, &info.Name, &info.DataType, &info.ContentType,
 		&info.Size, &info.Hash, &info.FilePath, &info.DirectoryPath,
 		&info.FileCount, &info.AccessMode, &tagsJSON, &metadataJSON,
@@ -354,9 +397,8 @@ func (s *SQLiteBackend) List(ctx context.Context, prefix string) ([]*DataInfo, e
 
 // Exists 检查数据是否存在
 func (s *SQLiteBackend) Exists(ctx context.Context, dataKey string) (bool, error) {
-	query := "SELECT 1 FROM objects WHERE data_key = ? LIMIT 1"
 	var exists int
-	err := s.db.QueryRowContext(ctx, query, dataKey).Scan(&exists)
+	err := s.existsStmt.QueryRowContext(ctx, dataKey).Scan(&exists)
 	if err != nil {
 		if err == sql.ErrNoRows {
 			return false, nil
@@ -432,5 +474,11 @@ func (s *SQLiteBackend) SaveDirectory(ctx context.Context, data *workload.DataWo
 
 // Close 关闭数据库连接
 func (s *SQLiteBackend) Close() error {
+	if s.existsStmt != nil {
+		s.existsStmt.Close()
+	}
+	if s.infoStmt != nil {
+		s.infoStmt.Close()
+	}
 	return s.db.Close()
 }
@@ -10,17 +10,21 @@ import (
 // MLModelWorkload ML模型workload
 type MLModelWorkload struct {
 	BaseWorkload
-	
+
 	// 模型标识
 	ModelType   string `json:"model_type"`   // "yolo", "tensorflow", "pytorch"
 	ModelPath   string `json:"model_path"`   // 模型文件路径
 	ModelConfig string `json:"model_config"` // 可选配置文件路径
 	Framework   string `json:"framework"`    // "yolov8", "yolov5", "tf2"等
-	
+
 	// 服务配置
 	ServicePort int    `json:"service_port"` // HTTP服务端口
 	ServiceHost string `json:"service_host"` // 服务host（默认localhost）
-	
+
+	// 推理加速配置
+	Backend string `json:"backend,omitempty"` // DNN计算后端: auto, default, opencv, openvino, cuda
+	Target  string `json:"target,omitempty"`  // DNN计算目标: cpu, cuda, cudafp16等（fp16约省一半带宽）
+
 	// 运行时信息
 	Endpoint   string `json:"endpoint,omitempty"`    // 推理服务endpoint
 	ProcessPID int    `json:"process_pid,omitempty"` // HTTP server进程PID
@@ -50,11 +54,11 @@ func NewMLModelWorkload(name string, req CreateWorkloadRequest) *MLModelWorkload
 		if modelType, ok := req.Config["model_type"].(string); ok {
 			workload.ModelType = modelType
 		}
-		
+
 		if modelPath, ok := req.Config["model_path"].(string); ok {
 			workload.ModelPath = modelPath
 		}
-		
+
 		if modelConfig, ok := req.Config["model_config"].(string); ok {
 			workload.ModelConfig = modelConfig
 		}
@@ -66,10 +70,18 @@ func NewMLModelWorkload(name string, req CreateWorkloadRequest) *MLModelWorkload
 		if port, ok := req.Config["service_port"].(float64); ok {
 			workload.ServicePort = int(port)
 		}
-		
+
 		if host, ok := req.Config["service_host"].(string); ok {
 			workload.ServiceHost = host
 		}
+
+		if backend, ok := req.Config["backend"].(string); ok {
+			workload.Backend = backend
+		}
+
+		if target, ok := req.Config["target"].(string); ok {
+			workload.Target = target
+		}
 	}
 
 	return workload
@@ -80,7 +92,7 @@ func (w *MLModelWorkload) Validate() error {
 	if w.ModelPath == "" {
 		return fmt.Errorf("model path cannot be empty")
 	}
-	
+
 	if w.ModelType == "" {
 		return fmt.Errorf("model type cannot be empty")
 	}
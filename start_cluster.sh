@@ -15,11 +15,28 @@ sleep 1
 # 创建日志目录
 mkdir -p logs
 
+# 轮询健康接口直到节点就绪：快启动的节点百毫秒内通过，
+# 不再每个节点固定等2秒；超时则报错退出
+wait_ready() {
+    local port=$1
+    local deadline=$((SECONDS + 15))
+    local delay=0.1
+    while [ $SECONDS -lt $deadline ]; do
+        if curl -sf "http://localhost:${port}/api/health" > /dev/null 2>&1; then
+            return 0
+        fi
+        sleep $delay
+        delay=$(awk "BEGIN { d = $delay * 1.5; print (d > 1) ? 1 : d }")
+    done
+    echo "   错误: 节点 localhost:${port} 未在超时时间内就绪"
+    return 1
+}
+
 echo "1. 启动江苏省节点 (jiangsu, port 8080)..."
 ./bin/cnet-agent -config configs/config_jiangsu.yaml > logs/jiangsu.log 2>&1 &
 JIANGSU_PID=$!
 echo "   PID: $JIANGSU_PID"
-sleep 2
+wait_ready 8080
 
 echo ""
 echo "2. 启动南京市节点 (nanjing, port 8081)..."
@@ -27,14 +44,14 @@ echo "   将注册到江苏省节点 localhost:8080"
 ./bin/cnet-agent -config configs/config_nanjing.yaml > logs/nanjing.log 2>&1 &
 NANJING_PID=$!
 echo "   PID: $NANJING_PID"
-sleep 2
+wait_ready 8081
 
 echo ""
 echo "3. 启动宿迁市节点 (suqian, port 8082)..."
 ./bin/cnet-agent -config configs/config_suqian.yaml > logs/suqian.log 2>&1 &
 SUQIAN_PID=$!
 echo "   PID: $SUQIAN_PID"
-sleep 2
+wait_ready 8082
 
 echo ""
 echo "4. 启动常州市节点 (changzhou, port 8083)..."
@@ -42,7 +59,7 @@ echo "   将与南京、宿迁互相发现"
 ./bin/cnet-agent -config configs/config_changzhou.yaml > logs/changzhou.log 2>&1 &
 CHANGZHOU_PID=$!
 echo "   PID: $CHANGZHOU_PID"
-sleep 2
+wait_ready 8083
 
 echo ""
 echo "=== 集群拓扑结构 ==="
@@ -64,8 +81,16 @@ echo "宿迁市:  http://localhost:8082  (PID: $SUQIAN_PID)"
 echo "常州市:  http://localhost:8083  (PID: $CHANGZHOU_PID)"
 echo ""
 
+# 轮询到宿迁节点看到peer即认为发现完成，最多等10秒
 echo "等待节点互相发现..."
-sleep 3
+DISCOVERY_DEADLINE=$((SECONDS + 10))
+while [ $SECONDS -lt $DISCOVERY_DEADLINE ]; do
+    PEER_COUNT=$(curl -s http://localhost:8082/api/nodes | jq '[.nodes[] | select(.node_type=="peer")] | length' 2>/dev/null || echo 0)
+    if [ "$PEER_COUNT" -gt 0 ] 2>/dev/null; then
+        break
+    fi
+    sleep 0.2
+done
 
 echo ""
 echo "=== 验证集群状态 ==="
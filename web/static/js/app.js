@@ -93,17 +93,30 @@ function dashboard() {
             }
         },
         
-        // 计算属性
+        // 状态统计：workloads更新时一次遍历算好三个计数，
+        // 模板读取时不再做三趟filter、每趟丢弃一个中间数组
+        workloadStats: { running: 0, completed: 0, failed: 0 },
+
+        updateWorkloadStats() {
+            const stats = { running: 0, completed: 0, failed: 0 };
+            for (const w of this.workloads) {
+                if (w.status in stats) {
+                    stats[w.status]++;
+                }
+            }
+            this.workloadStats = stats;
+        },
+
         get runningWorkloads() {
-            return this.workloads.filter(w => w.status === 'running').length;
+            return this.workloadStats.running;
         },
-        
+
         get completedWorkloads() {
-            return this.workloads.filter(w => w.status === 'completed').length;
+            return this.workloadStats.completed;
         },
-        
+
         get failedWorkloads() {
-            return this.workloads.filter(w => w.status === 'failed').length;
+            return this.workloadStats.failed;
         },
         
         // 初始化
@@ -172,6 +185,7 @@ function dashboard() {
                 const response = await fetch('/api/workloads');
                 const data = await response.json();
                 this.workloads = data.workloads || [];
+                this.updateWorkloadStats();
                 // 记录首个运行中的 DataGateway 入口与 bucket
                 const gw = this.workloads.find(w => w.type === 'datagateway' && w.status === 'running');
                 if (gw && gw.endpoint) {
@@ -540,10 +554,27 @@ function dashboard() {
             return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
         },
         
-        // 格式化日期
+        // 格式化日期：formatter构建一次复用，结果按原始串缓存；
+        // toLocaleString每次调用都要重建locale格式化器，
+        // 列表渲染里同一批时间戳会反复格式化
+        dateFormatter: new Intl.DateTimeFormat('zh-CN', {
+            year: 'numeric', month: 'numeric', day: 'numeric',
+            hour: 'numeric', minute: 'numeric', second: 'numeric'
+        }),
+        dateCache: new Map(),
+
         formatDate(dateString) {
             if (!dateString) return '-';
-            return new Date(dateString).toLocaleString('zh-CN');
+            let formatted = this.dateCache.get(dateString);
+            if (formatted === undefined) {
+                formatted = this.dateFormatter.format(new Date(dateString));
+                // 简单容量上限，防止长期运行下缓存无界增长
+                if (this.dateCache.size > 1000) {
+                    this.dateCache.clear();
+                }
+                this.dateCache.set(dateString, formatted);
+            }
+            return formatted;
         },
         
         // 获取状态颜色